@@ -33,6 +33,9 @@ class Config:
     LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
     MAX_WORKERS = int(os.getenv("MAX_WORKERS", "50"))
     TASK_QUEUE_SIZE = int(os.getenv("TASK_QUEUE_SIZE", "1000"))
+    MAX_CONCURRENT_LOGINS = int(os.getenv("MAX_CONCURRENT_LOGINS", "3"))
+    LOGIN_INTERVAL_SECONDS = float(os.getenv("LOGIN_INTERVAL_SECONDS", "6"))
+    PID_FILE = os.getenv("PID_FILE", "data/twitter-bot.pid")
 
     # Captcha solver configuration
     CAPSOLVER_API_KEY = os.getenv("CAPSOLVER_API_KEY", "")
@@ -27,6 +27,9 @@ class CookieProcessor:
     
     # All possible cookie names we should handle
     ALL_COOKIE_NAMES = REQUIRED_COOKIES + OPTIONAL_COOKIES
+
+    # Set form for membership tests while scanning large browser exports
+    _COOKIE_NAME_SET = frozenset(ALL_COOKIE_NAMES)
     
     @staticmethod
     def process_cookies(raw_cookies: Any) -> Dict[str, str]:
@@ -59,23 +62,20 @@ class CookieProcessor:
     @staticmethod
     def _process_list_cookies(cookie_list: List[Dict[str, Any]]) -> Dict[str, str]:
         """Process browser-exported cookie array"""
-        processed = {}
-        
-        for cookie in cookie_list:
-            if not isinstance(cookie, dict):
-                continue
-            
-            # Get cookie name and value
-            name = cookie.get('name', '')
-            value = cookie.get('value', '')
-            
-            # Only include cookies we care about
-            if name in CookieProcessor.ALL_COOKIE_NAMES and value:
-                processed[name] = value
-                
-                # Log cookie info (without exposing full value)
-                bot_logger.debug(f"Processed cookie: {name} = {value[:10]}...")
-        
+        names = CookieProcessor._COOKIE_NAME_SET
+
+        # Only include cookies we care about, skipping malformed entries
+        processed = {
+            cookie['name']: cookie['value']
+            for cookie in cookie_list
+            if isinstance(cookie, dict)
+            and cookie.get('name') in names
+            and cookie.get('value')
+        }
+
+        # Log once per export (names only, never values)
+        bot_logger.debug(f"Processed cookies: {', '.join(processed)}")
+
         return processed
     
     @staticmethod
@@ -85,7 +85,7 @@ class CookieProcessor:
         
         for name, value in cookie_dict.items():
             # Only include cookies we care about
-            if name in CookieProcessor.ALL_COOKIE_NAMES and value:
+            if name in CookieProcessor._COOKIE_NAME_SET and value:
                 # Ensure value is string
                 processed[name] = str(value)
         
@@ -168,7 +168,7 @@ class CookieProcessor:
         formatted = {}
         
         for name, value in cookies.items():
-            if name in CookieProcessor.ALL_COOKIE_NAMES:
+            if name in CookieProcessor._COOKIE_NAME_SET:
                 # Ensure value is a string and cleaned
                 formatted[name] = str(value).strip()
         
@@ -9,6 +9,12 @@ from typing import Dict, List, Any, Optional
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up, fall back to the stdlib encoder
+    orjson = None
+
 import logging
 from config import Config
 from database_initializer import initialize_database
@@ -28,6 +34,9 @@ class Database:
         # Initialize encryption
         self.cipher = self._init_encryption()
 
+        # auth_token -> [bot_id, ...] index, dropped by every _write_data
+        self._auth_token_index: Optional[Dict[str, List[str]]] = None
+
         # Initialize database
         self._init_database()
 
@@ -218,9 +227,17 @@ class Database:
 
     def _write_data(self, data: Dict[str, Any]):
         """Encrypt and write database data"""
+        # Every write goes through here, so this is where the index goes stale
+        self._auth_token_index = None
+
         try:
-            json_data = json.dumps(data, indent=2)
-            encrypted_data = self.cipher.encrypt(json_data.encode())
+            # orjson returns bytes, so there is no str round trip before
+            # encrypting; the file is encrypted, so indentation buys nothing
+            if orjson is not None:
+                json_bytes = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                json_bytes = json.dumps(data).encode()
+            encrypted_data = self.cipher.encrypt(json_bytes)
 
             with open(self.db_path, "wb") as f:
                 f.write(encrypted_data)
@@ -325,6 +342,47 @@ class Database:
 
         return bots
 
+    def get_bots_by_status(self, status: str) -> Dict[str, Any]:
+        """Get the bots whose status matches"""
+        return {
+            bot_id: bot_info
+            for bot_id, bot_info in self.get_all_bots().items()
+            if isinstance(bot_info, dict) and bot_info.get("status") == status
+        }
+
+    def _get_auth_token_index(self) -> Dict[str, List[str]]:
+        """Return the auth_token -> bot ids index, rebuilding it if stale"""
+        # Only decrypt and rescan the bots after the database was written
+        if self._auth_token_index is None:
+            index: Dict[str, List[str]] = {}
+            for bot_id, bot_info in self.get_all_bots().items():
+                if not isinstance(bot_info, dict):
+                    continue
+                cookies = bot_info.get("cookies", {})
+                if isinstance(cookies, dict) and cookies.get("auth_token"):
+                    index.setdefault(cookies["auth_token"], []).append(bot_id)
+
+            self._auth_token_index = index
+
+        return self._auth_token_index
+
+    def find_bot_by_auth_token(self, auth_token: str) -> Optional[str]:
+        """Return the id of the bot using this auth_token, if any"""
+        bot_ids = self._get_auth_token_index().get(auth_token)
+        return bot_ids[0] if bot_ids else None
+
+    def count_bots_with_auth_token(self) -> int:
+        """Return how many bots have an auth_token"""
+        return sum(len(bot_ids) for bot_ids in self._get_auth_token_index().values())
+
+    def get_duplicate_auth_tokens(self) -> Dict[str, List[str]]:
+        """Return auth tokens shared by more than one bot, with their bot ids"""
+        return {
+            auth_token: list(bot_ids)
+            for auth_token, bot_ids in self._get_auth_token_index().items()
+            if len(bot_ids) > 1
+        }
+
     def update_bot_status(self, bot_id: str, status: str, **kwargs) -> bool:
         """Update bot status and other properties"""
         try:
@@ -345,22 +403,41 @@ class Database:
             return False
 
     # User Pool Management
+    @staticmethod
+    def pool_key(keyword: str) -> str:
+        """Canonical users_pool key for a keyword (case-insensitive)"""
+        return keyword.strip().lower()
+
+    def _find_pool(
+        self, data: Dict[str, Any], keyword: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return the pool for keyword, or None if there is none
+
+        Pools saved under a mixed-case key before keys were canonicalised
+        are moved to the canonical key (persisted on the caller's next write).
+        """
+        pools = data.setdefault("users_pool", {})
+        key = self.pool_key(keyword)
+        if key not in pools:
+            for stored_key in list(pools):
+                if self.pool_key(stored_key) == key:
+                    pools[key] = pools.pop(stored_key)
+                    break
+        return pools.get(key)
+
     def add_users_to_pool(self, keyword: str, users: List[str]) -> bool:
         """Add users to the pool for a keyword"""
         try:
             data = self._read_data()
-            if "users_pool" not in data:
-                data["users_pool"] = {}
-
-            if keyword not in data["users_pool"]:
-                data["users_pool"][keyword] = {
+            pool = self._find_pool(data, keyword)
+            if pool is None:
+                pool = data["users_pool"][self.pool_key(keyword)] = {
                     "users": [],
                     "used_users": [],
                     "created_at": None,
                 }
 
             # Add new users that aren't already used
-            pool = data["users_pool"][keyword]
             for user in users:
                 if user not in pool["users"] and user not in pool["used_users"]:
                     pool["users"].append(user)
@@ -376,10 +453,10 @@ class Database:
         """Get users from pool for a keyword"""
         try:
             data = self._read_data()
-            if keyword not in data.get("users_pool", {}):
+            pool = self._find_pool(data, keyword)
+            if pool is None:
                 return []
 
-            pool = data["users_pool"][keyword]
             available_users = pool["users"][:count]
 
             if available_users:
@@ -396,17 +473,47 @@ class Database:
             self.logger.error(f"Failed to get users from pool for {keyword}: {e}")
             return []
 
+    def get_user_pool(self, keyword: str) -> Dict[str, Any]:
+        """Get the pool for a keyword ({} if there is none)"""
+        try:
+            return self._find_pool(self._read_data(), keyword) or {}
+        except Exception as e:
+            self.logger.error(f"Failed to get user pool for {keyword}: {e}")
+            return {}
+
+    def reset_user_pool(self, keyword: str, created_at: str) -> bool:
+        """Empty an existing pool for a keyword before it is rebuilt"""
+        try:
+            data = self._read_data()
+            if self._find_pool(data, keyword) is not None:
+                data["users_pool"][self.pool_key(keyword)] = {
+                    "users": [],
+                    "used_users": [],
+                    "created_at": created_at,
+                }
+                self._write_data(data)
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to reset user pool for {keyword}: {e}")
+            return False
+
     # Task Management
     def add_task(self, task: Dict[str, Any]) -> bool:
         """Add a new task to the queue"""
+        return self.add_tasks([task])
+
+    def add_tasks(self, tasks: List[Dict[str, Any]]) -> bool:
+        """Add several tasks with a single read/write of the database"""
         try:
             data = self._read_data()
             if "tasks" not in data:
                 data["tasks"] = []
 
-            task["id"] = len(data["tasks"]) + 1
-            task["created_at"] = None  # Will be set by caller
-            data["tasks"].append(task)
+            for task in tasks:
+                task["id"] = len(data["tasks"]) + 1
+                task["created_at"] = None  # Will be set by caller
+                data["tasks"].append(task)
 
             self._write_data(data)
             return True
@@ -208,12 +208,23 @@ class BotLogger:
             if not os.path.exists(Config.LOG_FILE_PATH):
                 return "No log file found"
 
-            with open(Config.LOG_FILE_PATH, "r") as f:
-                all_lines = f.readlines()
-                recent_lines = (
-                    all_lines[-lines:] if len(all_lines) > lines else all_lines
-                )
-                return "".join(recent_lines)
+            # Read only the tail of the file, growing the window until it
+            # holds enough lines, instead of loading the whole log
+            with open(Config.LOG_FILE_PATH, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                window = 64 * 1024
+                while True:
+                    start = max(0, size - window)
+                    f.seek(start)
+                    chunk = f.read()
+                    recent_lines = chunk.splitlines(keepends=True)
+                    # The first line may be cut off unless we read from the start
+                    if start == 0 or len(recent_lines) > lines:
+                        break
+                    window *= 2
+
+            recent_lines = recent_lines[-lines:]
+            return b"".join(recent_lines).decode("utf-8", errors="replace")
 
         except Exception as e:
             self.logger.error(f"Failed to read recent logs: {e}")
@@ -8,6 +8,11 @@ import sys
 import os
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # Optional faster event loop, not built for Windows
+    uvloop = None
+
 # Add current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -15,7 +20,10 @@ from telegram_bot import main
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\n👋 Shutting down gracefully...")
     except Exception as e:
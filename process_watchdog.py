@@ -108,7 +108,7 @@ class ProcessWatchdog:
     def find_process(self, process_name: str) -> Optional[psutil.Process]:
         """Find a running process by name"""
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            for proc in psutil.process_iter(['cmdline']):
                 try:
                     if proc.info['cmdline'] and any(process_name in cmd for cmd in proc.info['cmdline']):
                         return proc
@@ -187,6 +187,12 @@ class TaskScheduler:
         self.task_queue: asyncio.Queue = asyncio.Queue(maxsize=Config.TASK_QUEUE_SIZE)
         self.active_tasks: Dict[str, Task] = {}
         self.is_running = False
+
+        # Task records waiting to be written to the database. Adds arriving
+        # within the flush delay share one decrypt/encrypt cycle.
+        self._pending_db_tasks: List[Dict[str, Any]] = []
+        self._db_flush_task: Optional[asyncio.Task] = None
+        self._db_flush_delay = 0.005
         
         # Callback for task completion notifications
         self.task_complete_callback: Optional[Callable] = None
@@ -218,6 +224,7 @@ class TaskScheduler:
     async def stop(self):
         """Stop the scheduler"""
         self.is_running = False
+        self._flush_pending_db_tasks()
         self.logger.info("Task scheduler stopped")
 
     async def add_task(
@@ -244,8 +251,8 @@ class TaskScheduler:
             await self.task_queue.put(task)
             self.active_tasks[task_id] = task
 
-            # Add to database
-            self.db.add_task(
+            # Add to database (batched with other adds in the same window)
+            self._pending_db_tasks.append(
                 {
                     "id": task_id,
                     "task_type": task_type.value,
@@ -256,6 +263,8 @@ class TaskScheduler:
                     "scheduled_for": scheduled_for.isoformat(),
                 }
             )
+            if self._db_flush_task is None:
+                self._db_flush_task = asyncio.create_task(self._flush_db_tasks())
 
             self.logger.info(
                 f"Task {task_id} added to queue (scheduled for {scheduled_for})"
@@ -266,6 +275,18 @@ class TaskScheduler:
             self.logger.error(f"Failed to add task: {e}")
             return None
 
+    async def _flush_db_tasks(self):
+        """Persist buffered task records after a short coalescing delay"""
+        await asyncio.sleep(self._db_flush_delay)
+        self._db_flush_task = None
+        self._flush_pending_db_tasks()
+
+    def _flush_pending_db_tasks(self):
+        """Write all buffered task records in one database update"""
+        batch, self._pending_db_tasks = self._pending_db_tasks, []
+        if batch:
+            self.db.add_tasks(batch)
+
     async def _process_tasks(self):
         """Process tasks from the queue"""
         while self.is_running:
@@ -3,15 +3,27 @@ Main Telegram bot command center with proper proxy and Cloudflare bypass support
 """
 
 import asyncio
+import functools
+import importlib.util
+import inspect
 import json
 import os
-import shutil
-import subprocess
-import psutil
+import random
+import re
+import secrets
+import sys
+import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional
-from telegram import Update, Bot, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import (
+    Update,
+    Bot,
+    BotCommand,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+)
 from telegram.ext import (
+    AIORateLimiter,
     Application,
     CommandHandler,
     MessageHandler,
@@ -20,6 +32,22 @@ from telegram.ext import (
     CallbackQueryHandler,
 )
 from telegram.error import TelegramError
+import twikit
+
+try:
+    from twikit._captcha.capsolver import Capsolver as TwikitCapsolver
+except ImportError:  # Not shipped by every Twikit version
+    TwikitCapsolver = None
+
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:  # Logins fall back to a random pause without it
+    AsyncLimiter = None
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up, fall back to the stdlib encoder
+    orjson = None
 
 from config import Config
 from database import Database
@@ -27,12 +55,430 @@ from worker_manager import WorkerManager, TwitterWorker
 from scheduler import TaskScheduler, TaskType
 from twitter_engine import TwitterSearchEngine, TwitterEngagementEngine
 from logger import bot_logger
-from captcha_solver import captcha_solver
+from captcha_solver import CaptchaSolver, captcha_solver
+from cookie_processor import CookieProcessor
+
+# Message filters are built once at import rather than on every setup_handlers
+_JSON_DOC_FILTER = filters.Document.MimeType("application/json")
+
+# httpx only speaks HTTP/2 with h2 installed (python-telegram-bot[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Cookies a bot cannot authenticate without
+_REQUIRED_COOKIE_FIELDS = frozenset(("auth_token", "ct0"))
+
+# Single-action commands and the task each one schedules
+_SINGLE_ACTION_TASKS = {
+    "like": TaskType.LIKE,
+    "retweet": TaskType.RETWEET,
+    "comment": TaskType.COMMENT,
+}
+
+# Tweet links accepted by /like, /retweet and /comment
+_TWEET_URL_RE = re.compile(
+    r"^(?:https?://)?(?:www\.|mobile\.)?(?:x|twitter)\.com/(?:i/web|[^/\s]+)/status/\d+"
+)
+
+# Twikit feature detection is fixed for the installed version - inspect once
+_LOGIN_PARAMS = inspect.signature(twikit.Client.login).parameters
+_CLIENT_PARAMS = inspect.signature(twikit.Client.__init__).parameters
+
+# Telegram autocomplete entries registered by set_bot_commands
+_BOT_COMMANDS = (
+    BotCommand("start", "Show main menu"),
+    BotCommand("help", "Show all available commands"),
+    BotCommand("status", "Show system and bot status"),
+    BotCommand("logs", "View recent system logs"),
+    BotCommand("addbot", "Add new worker bot from cookie file"),
+    BotCommand("addbotjson", "Add bot directly with JSON cookie data"),
+    BotCommand("addbotlogin", "Add bot via username/password login"),
+    BotCommand("removebot", "Remove worker bot"),
+    BotCommand("disable", "Disable a bot (mark as inactive)"),
+    BotCommand("enable", "Enable a disabled bot"),
+    BotCommand("delete", "Permanently delete a bot"),
+    BotCommand("listbots", "List all worker bots and their status"),
+    BotCommand("syncfollows", "Sync mutual following between all bots"),
+    BotCommand("post", "Like, comment, and retweet a specific post"),
+    BotCommand("like", "Like a specific post"),
+    BotCommand("retweet", "Retweet a specific post"),
+    BotCommand("comment", "Comment on a specific post"),
+    BotCommand("quote", "Quote tweets containing keyword with mentions"),
+    BotCommand("unfollow", "Unfollow all followers for a specific bot"),
+    BotCommand("search", "Search for tweets with keyword"),
+    BotCommand("pool", "Show user pool status for keyword"),
+    BotCommand("refresh", "Refresh user pool for keyword"),
+    BotCommand("stats", "Show engagement statistics"),
+    BotCommand("queue", "Show pending and in-progress tasks"),
+    BotCommand("test", "Diagnose bot authentication and basic functionality"),
+    BotCommand("reinit", "Reinitialize bot authentication for all workers"),
+    BotCommand("version", "Check Twikit version and capabilities"),
+    BotCommand("testlogin", "Test if login is blocked by Cloudflare"),
+    BotCommand("captchastatus", "Show captcha solver and proxy status"),
+    BotCommand("cloudflare", "Get Cloudflare cookies for bypass"),
+    BotCommand("reactivate", "Reactivate inactive bots"),
+    BotCommand("checkduplicates", "Check for duplicate auth_tokens"),
+    BotCommand("cleanup", "Remove all inactive bots from the database"),
+    BotCommand("savecookies", "Save all bot cookies to files"),
+    BotCommand(
+        "update",
+        "Interactive update menu (update & restart, restart only, restart system, check status)",
+    ),
+    BotCommand("restart", "Restart bot without updating code"),
+    BotCommand("backup", "Create backup of system data"),
+)
+
+# Static texts of the inline menus
+_WELCOME_TEXT = (
+    "🤖 **Twitter Bot System**\n\n"
+    "Welcome to your Twitter automation command center!\n\n"
+    "Choose an action from the menu below:"
+)
+
+_ENGAGEMENT_MENU_TEXT = (
+    "🎯 **Engagement Actions**\n\n"
+    "Choose an engagement action:\n\n"
+    "**Quick Actions:**\n"
+    "• Like, comment, and retweet posts\n"
+    "• Quote tweets with mentions\n"
+    "• Manage user pools\n"
+    "• Unfollow operations"
+)
+
+_SEARCH_MENU_TEXT = (
+    "🔍 **Search & Pools**\n\n"
+    "Manage Twitter search and user pools:\n\n"
+    "**Features:**\n"
+    "• Search for tweets by keywords\n"
+    "• Manage user pools for mentions\n"
+    "• Refresh user data\n"
+    "• Track engagement targets"
+)
+
+_SYSTEM_MENU_TEXT = (
+    "⚙️ **System Management**\n\n"
+    "System administration and maintenance:\n\n"
+    "**Available Actions:**\n"
+    "• Test system components\n"
+    "• Reinitialize bots\n"
+    "• Version information\n"
+    "• System diagnostics"
+)
+
+_HELP_MENU_TEXT = (
+    "📋 **Help & Commands**\n\n"
+    "**Quick Commands:**\n"
+    "• `/start` - Show main menu\n"
+    "• `/help` - Detailed command reference\n"
+    "• `/status` - System status\n"
+    "• `/logs` - View recent logs\n\n"
+    "**Bot Management:**\n"
+    "• `/addbot` - Add new bot\n"
+    "• `/listbots` - List all bots\n"
+    "• `/removebot <id>` - Remove bot\n\n"
+    "**Engagement:**\n"
+    "• `/post <url>` - Engage with post\n"
+    '• `/quote <keyword> "<text>"` - Quote tweet\n'
+    "• `/like <url>` - Like post\n"
+    '• `/comment <url> "<text>"` - Comment\n\n'
+    "Use the menu buttons for easy access!"
+)
+
+_STATS_MENU_TEXT = "📈 Statistics Menu\n\nChoose a category:"
+
+_LOGS_MENU_TEXT = (
+    "📝 **System Logs**\n\n"
+    "View recent system activity and logs:\n\n"
+    "**Log Types:**\n"
+    "• System logs\n"
+    "• Bot activity\n"
+    "• Error logs\n"
+    "• Engagement logs"
+)
+
+# Full /help reference, sent as plain text
+_HELP_TEXT = """
+📖 Twitter Bot Commands Reference
+
+🤖 Bot Management:
+• `/addbot <cookie_file>` - Add new worker bot from uploaded cookie file
+• `/addbotjson <json_data>` - Add bot directly with JSON cookie data
+• `/addbotlogin <username> <password> [email]` - Add bot via username/password login
+• `/removebot <bot_id>` - Remove worker bot
+• `/disable <bot_id>` - Disable a bot (mark as inactive)
+• `/enable <bot_id>` - Enable a disabled bot
+• `/delete <bot_id>` - Permanently delete a bot
+• `/listbots` - List all worker bots and their status
+• `/syncfollows` - Sync mutual following between all bots
+
+⚙️ System Management:
+• `/update` - Interactive update menu (update & restart, restart only, restart system, check status)
+• `/restart` - Restart bot without updating code
+
+👥 Admin Management:
+• `/addadmin <user_id>` - Add a new admin (get ID from @userinfobot)
+• `/removeadmin <user_id>` - Remove an admin
+• `/listadmins` - Show all admins
+
+🎯 Engagement Commands:
+• `/post <url>` - Like, comment, and retweet a specific post
+• `/like <url>` - Like a specific post
+• `/retweet <url>` - Retweet a specific post
+• `/comment <url> "<text>"` - Comment on a specific post
+• `/quote <keyword> "<message>"` - Quote tweets containing keyword with mentions
+• `/unfollow <bot_id>` - Unfollow all followers for a specific bot
+• `/unfollow all` - Unfollow all followers for all bots
+
+🔍 Search & Pools:
+• `/search <keyword>` - Search for tweets with keyword
+• `/pool <keyword>` - Show user pool status for keyword
+• `/refresh <keyword>` - Refresh user pool for keyword
+
+📊 Monitoring:
+• `/status` - Show system status and bot health
+• `/stats` - Show engagement statistics
+• `/queue` - Show task queue status
+• `/logs` - View recent system logs
+• `/backup` - Create database backup
+
+💡 Tips:
+• Upload cookie files as JSON documents
+• Use quotes around messages with spaces
+• Check `/status` regularly for bot health
+• Monitor `/logs` for errors and notifications
+"""
+
+# Fixed replies for the bot, engagement and system menu buttons
+_BOT_ACTION_TEXT = {
+    "bot_add": (
+        "🤖 **Add Bot**\n\n"
+        "Choose how to add a bot:\n"
+        "• Upload cookie file and use `/addbot <filename>`\n"
+        "• Use `/addbotjson <json_data>` for direct JSON\n"
+        "• Use `/addbotlogin <username> <password>` for login\n\n"
+        "Or use the commands directly!"
+    ),
+    "bot_list": (
+        "📋 **Bot List**\n\n"
+        "Use `/listbots` to see all your bots with their status."
+    ),
+    "bot_sync": (
+        "🔄 **Sync Follows**\n\n"
+        "Use `/syncfollows` to sync mutual following between all bots."
+    ),
+    "bot_cleanup": (
+        "🧹 **Cleanup**\n\n"
+        "Use `/cleanup` to remove inactive/failed bots from the database."
+    ),
+}
+
+_ENGAGEMENT_ACTION_TEXT = {
+    "engagement_post": (
+        "💬 **Post Engagement**\n\n"
+        "Use `/post <url>` to like, comment, and retweet a post."
+    ),
+    "engagement_quote": (
+        "💭 **Quote Tweet**\n\n"
+        'Use `/quote <keyword> "<message>"` to quote tweets with mentions.'
+    ),
+    "engagement_like": "❤️ **Like Post**\n\nUse `/like <url>` to like a specific post.",
+    "engagement_retweet": "🔄 **Retweet**\n\nUse `/retweet <url>` to retweet a specific post.",
+    "engagement_comment": '💬 **Comment**\n\nUse `/comment <url> "<text>"` to comment on a post.',
+    "engagement_unfollow": (
+        "👥 **Unfollow**\n\n"
+        "Use `/unfollow <bot_id>` or `/unfollow all` to unfollow users."
+    ),
+}
+
+_SYSTEM_ACTION_TEXT = {
+    "system_test": (
+        "🧪 **Test System**\n\n"
+        "Use `/test` to test bot authentication and functionality."
+    ),
+    "system_reinit": (
+        "🔄 **Reinitialize**\n\n"
+        "Use `/reinit` to reinitialize bot authentication for all workers."
+    ),
+    "system_version": (
+        "📋 **Version Info**\n\n"
+        "Use `/version` to check Twikit version and capabilities."
+    ),
+    "system_testlogin": (
+        "🔍 **Test Login**\n\n"
+        "Use `/testlogin` to test if login is blocked by Cloudflare."
+    ),
+    "system_update": (
+        "⬆️ **Update Bot**\n\n"
+        "Use `/update` to pull latest code from GitHub and restart the bot."
+    ),
+    "system_restart": (
+        "🔄 **Restart Bot**\n\n"
+        "Use `/restart` to restart the bot without updating code."
+    ),
+}
+
+# Static reply texts
+_ACCESS_DENIED = "❌ Access denied. You are not an admin."
+
+_USAGE_ADDBOTLOGIN = (
+    "❌ Please provide username and password.\n"
+    "Usage: `/addbotlogin <username> <password> [email]`\n\n"
+    "Example:\n"
+    "`/addbotlogin myusername mypassword123`\n"
+    "`/addbotlogin myusername mypassword123 email@example.com`\n\n"
+    "Note: This will automatically save cookies after successful login."
+)
+
+_CF_BLOCKED_HELP = (
+    "❌ Login is BLOCKED by Cloudflare\n\n"
+    "🔧 Solutions:\n"
+    "1. ✅ Use cookie upload method: `/addbot` or `/addbotjson`\n"
+    "2. Enable captcha solver: Set `USE_CAPTCHA_SOLVER=true`\n"
+    "3. Enable cloudscraper: Set `USE_CLOUDSCRAPER=true`\n"
+    "4. Configure residential proxy (currently: {proxy_status})\n\n"
+    "💡 Run `/captchastatus` for detailed status"
+)
+
+_SYSTEM_STATUS_TEMPLATE = (
+    "📊 **System Status**\n\n"
+    "🤖 **Bot Process:**\n"
+    "• Status: {bot_status}\n"
+    "• PID: {bot_pid}\n\n"
+    "🔄 **Webhook Service:**\n"
+    "• Status: {service_status}\n"
+    "• PID: {service_pid}\n"
+    "• Health: {webhook_health}\n\n"
+    "🔌 **Proxy:**\n"
+    "• Configured: {proxy_status}\n\n"
+    "📅 **Last Check:** {checked_at}"
+)
+
+# Characters of git pull output shown after /update
+_UPDATE_OUTPUT_LIMIT = 300
+
+# Login errors that mean Twitter/Cloudflare blocked the request
+_LOGIN_BLOCKED_RE = re.compile(r"403|Cloudflare|blocked")
+_SSL_ERROR_RE = re.compile(r"ssl|certificate", re.IGNORECASE)
+
+
+def _file_timestamp() -> str:
+    """UTC timestamp for file names (no timezone lookup, stable across DST)"""
+    return time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+
+
+def _cookie_file_path(bot_id: str) -> str:
+    """Path of the saved cookie file for a bot"""
+    return os.path.join(Config.COOKIES_PATH, f"{bot_id}_cookies.json")
+
+
+def _read_json_file(path: str) -> Any:
+    """Load a JSON file (blocking - call via asyncio.to_thread)"""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _loads_json(data: Any) -> Any:
+    """Parse JSON from str or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json_file(path: str, data: Any):
+    """Write data as indented JSON (blocking - call via asyncio.to_thread)"""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def admin_required(handler):
+    """Reply with access denied instead of running handler for non-admins"""
+
+    @functools.wraps(handler)
+    async def wrapper(self, update: Update, context: ContextTypes.DEFAULT_TYPE, *args):
+        if not self._is_admin(update.effective_user.id):
+            await update.message.reply_text(_ACCESS_DENIED)
+            return
+        return await handler(self, update, context, *args)
+
+    return wrapper
 
 
 class TwitterBotTelegram:
     """Main Telegram bot for Twitter automation system"""
 
+    # (command, handler method) pairs registered by setup_handlers
+    _COMMANDS = (
+        # General
+        ("start", "start_command"),
+        ("help", "help_command"),
+        ("status", "status_command"),
+        ("logs", "logs_command"),
+        # Bot management
+        ("addbot", "addbot_command"),
+        ("addbotjson", "addbotjson_command"),
+        ("addbotlogin", "addbotlogin_command"),
+        ("removebot", "removebot_command"),
+        ("listbots", "listbots_command"),
+        ("syncfollows", "syncfollows_command"),
+        ("disable", "disable_command"),
+        ("enable", "enable_command"),
+        ("delete", "delete_command"),
+        ("savecookies", "savecookies_command"),
+        # Engagement
+        ("post", "post_command"),
+        ("quote", "quote_command"),
+        ("like", "like_command"),
+        ("retweet", "retweet_command"),
+        ("comment", "comment_command"),
+        ("unfollow", "unfollow_command"),
+        # Search and pool management
+        ("search", "search_command"),
+        ("pool", "pool_command"),
+        ("refresh", "refresh_command"),
+        # System
+        ("stats", "stats_command"),
+        ("queue", "queue_command"),
+        ("backup", "backup_command"),
+        ("test", "test_command"),
+        ("reinit", "reinit_command"),
+        ("version", "version_command"),
+        ("testlogin", "testlogin_command"),
+        ("captchastatus", "captchastatus_command"),
+        ("cloudflare", "cloudflare_command"),
+        ("reactivate", "reactivate_command"),
+        ("checkduplicates", "checkduplicates_command"),
+        ("cleanup", "cleanup_command"),
+        ("update", "update_command"),
+        ("restart", "restart_command"),
+        # Admin management
+        ("addadmin", "addadmin_command"),
+        ("removeadmin", "removeadmin_command"),
+        ("listadmins", "listadmins_command"),
+    )
+
+    # Slow commands (logins, network tests, bulk work) run without blocking
+    # the update loop so quick commands like /status are not stuck behind them
+    _NON_BLOCKING_COMMANDS = frozenset(
+        {
+            "addbotlogin",
+            "addbot",
+            "update",
+            "testlogin",
+            "syncfollows",
+            "backup",
+            "test",
+            "reinit",
+        }
+    )
+
     def __init__(self):
         self.config = Config
         self.db = Database()
@@ -42,110 +488,371 @@ class TwitterBotTelegram:
         self.engagement_engine = TwitterEngagementEngine(self.db, self.search_engine)
         self.logger = bot_logger
 
+        # Callback routing: exact callback_data matches take the query, the
+        # prefix families also get the callback_data
+        self._exact_routes = {
+            "menu_status": self._show_status_menu,
+            "menu_bots": self._show_bot_management_menu,
+            "menu_engagement": self._show_engagement_menu,
+            "menu_search": self._show_search_menu,
+            "menu_stats": self._show_stats_menu,
+            "menu_system": self._show_system_menu,
+            "menu_help": self._show_help_menu,
+            "menu_logs": self._show_logs_menu,
+            "back_to_main": self._show_main_menu,
+            "check_status": self._handle_status_check,
+            "cancel_update": self._cancel_update,
+        }
+        self._prefix_routes = (
+            ("bot_", self._handle_bot_action),
+            ("engagement_", self._handle_engagement_action),
+            ("system_", self._handle_system_action),
+            ("update_", self._handle_update_action),
+            ("restart_", self._handle_restart_action),
+        )
+
+        # Cookie files are written by several handlers - create the directory once
+        os.makedirs(Config.COOKIES_PATH, exist_ok=True)
+
+        # Static /start and /update menus and /help text never change - build them once
+        self._main_menu_markup = InlineKeyboardMarkup(
+            [
+                [
+                    InlineKeyboardButton("📊 Status", callback_data="menu_status"),
+                    InlineKeyboardButton("🤖 Bot Management", callback_data="menu_bots"),
+                ],
+                [
+                    InlineKeyboardButton("🎯 Engagement", callback_data="menu_engagement"),
+                    InlineKeyboardButton("🔍 Search & Pools", callback_data="menu_search"),
+                ],
+                [
+                    InlineKeyboardButton("📈 Statistics", callback_data="menu_stats"),
+                    InlineKeyboardButton("⚙️ System", callback_data="menu_system"),
+                ],
+                [
+                    InlineKeyboardButton("📋 Help", callback_data="menu_help"),
+                    InlineKeyboardButton("📝 Logs", callback_data="menu_logs"),
+                ],
+            ]
+        )
+        self._update_markup = InlineKeyboardMarkup(
+            [
+                [
+                    InlineKeyboardButton(
+                        "🔄 Update & Restart Bot", callback_data="update_restart_bot"
+                    ),
+                    InlineKeyboardButton(
+                        "🔄 Restart Bot Only", callback_data="restart_bot_only"
+                    ),
+                ],
+                [
+                    InlineKeyboardButton(
+                        "🔄 Restart System", callback_data="restart_system"
+                    ),
+                    InlineKeyboardButton("📋 Check Status", callback_data="check_status"),
+                ],
+                [InlineKeyboardButton("❌ Cancel", callback_data="cancel_update")],
+            ]
+        )
+
+        # Inline menus shown by the menu callbacks are static too
+        self._menu_markups = {
+            "status": InlineKeyboardMarkup(
+                [
+                    [
+                        InlineKeyboardButton("🔄 Refresh Status", callback_data="menu_status"),
+                        InlineKeyboardButton("🤖 View All Bots", callback_data="menu_bots"),
+                    ],
+                    [
+                        InlineKeyboardButton("📈 Detailed Stats", callback_data="menu_stats"),
+                        InlineKeyboardButton("📝 View Logs", callback_data="menu_logs"),
+                    ],
+                    [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
+                ]
+            ),
+            "status_check": InlineKeyboardMarkup(
+                [
+                    [InlineKeyboardButton("🔄 Refresh Status", callback_data="check_status")],
+                    [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
+                ]
+            ),
+            "bots": InlineKeyboardMarkup(
+                [
+                    [
+                        InlineKeyboardButton("➕ Add Bot", callback_data="bot_add"),
+                        InlineKeyboardButton("📋 List Bots", callback_data="bot_list"),
+                    ],
+                    [
+                        InlineKeyboardButton("🔄 Sync Follows", callback_data="bot_sync"),
+                        InlineKeyboardButton("🧹 Cleanup", callback_data="bot_cleanup"),
+                    ],
+                    [
+                        InlineKeyboardButton(
+                            "💾 Save Cookies", callback_data="bot_save_cookies"
+                        ),
+                        InlineKeyboardButton(
+                            "🔍 Check Duplicates", callback_data="bot_check_duplicates"
+                        ),
+                    ],
+                    [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
+                ]
+            ),
+            "engagement": InlineKeyboardMarkup(
+                [
+                    [
+                        InlineKeyboardButton(
+                            "💬 Post Engagement", callback_data="engagement_post"
+                        ),
+                        InlineKeyboardButton(
+                            "💭 Quote Tweet", callback_data="engagement_quote"
+                        ),
+                    ],
+                    [
+                        InlineKeyboardButton("❤️ Like Post", callback_data="engagement_like"),
+                        InlineKeyboardButton("🔄 Retweet", callback_data="engagement_retweet"),
+                    ],
+                    [
+                        InlineKeyboardButton("💬 Comment", callback_data="engagement_comment"),
+                        InlineKeyboardButton(
+                            "👥 Unfollow", callback_data="engagement_unfollow"
+                        ),
+                    ],
+                    [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
+                ]
+            ),
+            "search": InlineKeyboardMarkup(
+                [
+                    [
+                        InlineKeyboardButton("🔍 Search Tweets", callback_data="search_tweets"),
+                        InlineKeyboardButton("👥 Manage Pools", callback_data="search_pools"),
+                    ],
+                    [
+                        InlineKeyboardButton(
+                            "🔄 Refresh Pools", callback_data="search_refresh"
+                        ),
+                        InlineKeyboardButton("📊 Pool Stats", callback_data="search_stats"),
+                    ],
+                    [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
+                ]
+            ),
+            "stats": InlineKeyboardMarkup(
+                [
+                    [
+                        InlineKeyboardButton(
+                            "📊 Engagement Stats", callback_data="stats_engagement"
+                        ),
+                        InlineKeyboardButton("🤖 Bot Performance", callback_data="stats_bots"),
+                    ],
+                    [
+                        InlineKeyboardButton("⚡ Task Queue", callback_data="stats_queue"),
+                        InlineKeyboardButton(
+                            "💾 Database Stats", callback_data="stats_database"
+                        ),
+                    ],
+                    [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
+                ]
+            ),
+            "system": InlineKeyboardMarkup(
+                [
+                    [
+                        InlineKeyboardButton("🧪 Test System", callback_data="system_test"),
+                        InlineKeyboardButton("🔄 Reinitialize", callback_data="system_reinit"),
+                    ],
+                    [
+                        InlineKeyboardButton("📋 Version Info", callback_data="system_version"),
+                        InlineKeyboardButton(
+                            "🔧 Diagnostics", callback_data="system_diagnostics"
+                        ),
+                    ],
+                    [
+                        InlineKeyboardButton("💾 Backup", callback_data="system_backup"),
+                        InlineKeyboardButton("🔍 Test Login", callback_data="system_testlogin"),
+                    ],
+                    [
+                        InlineKeyboardButton("⬆️ Update Bot", callback_data="system_update"),
+                        InlineKeyboardButton("🔄 Restart Bot", callback_data="system_restart"),
+                    ],
+                    [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
+                ]
+            ),
+            "help": InlineKeyboardMarkup(
+                [
+                    [
+                        InlineKeyboardButton("📖 Full Help", callback_data="help_full"),
+                        InlineKeyboardButton("💡 Tips", callback_data="help_tips"),
+                    ],
+                    [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
+                ]
+            ),
+            "logs": InlineKeyboardMarkup(
+                [
+                    [
+                        InlineKeyboardButton("📋 Recent Logs", callback_data="logs_recent"),
+                        InlineKeyboardButton("❌ Error Logs", callback_data="logs_errors"),
+                    ],
+                    [
+                        InlineKeyboardButton("🤖 Bot Logs", callback_data="logs_bots"),
+                        InlineKeyboardButton("🎯 Activity Logs", callback_data="logs_activity"),
+                    ],
+                    [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
+                ]
+            ),
+        }
+
         # Telegram bot setup
-        self.application = (
-            Application.builder().token(self.config.TELEGRAM_TOKEN).build()
+        # concurrent_updates: a slow login or update in one chat must not
+        # hold up /status and the other chats behind it
+        builder = (
+            Application.builder()
+            .token(self.config.TELEGRAM_TOKEN)
+            .concurrent_updates(True)
         )
+        # The builder's default pool (256 connections) already covers
+        # concurrent handlers; HTTP/2 multiplexes them over one connection
+        if _HTTP2_AVAILABLE:
+            builder.http_version("2").get_updates_http_version("2")
+        # Queue replies under Telegram's 30 msg/s limit instead of bursting
+        # into 429s (needs the python-telegram-bot[rate-limiter] extra)
+        try:
+            builder.rate_limiter(
+                AIORateLimiter(overall_max_rate=30, overall_time_period=1)
+            )
+        except RuntimeError:
+            self.logger.warning(
+                "aiolimiter not installed - outgoing messages are not rate limited"
+            )
+        self.application = builder.build()
         self.setup_handlers()
 
-        # System status
+        # Admin ids for _is_admin: .env admins never change at runtime, the
+        # database set is loaded on first use and dropped when it changes
+        self._env_admin_ids = frozenset(
+            admin_id.strip() for admin_id in Config.TELEGRAM_ADMIN_IDS if admin_id.strip()
+        )
+        self._db_admin_ids: Optional[frozenset] = None
+
+        # Caps simultaneous /addbotlogin logins against Twitter
+        self._login_semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_LOGINS)
+        # Spaces logins out across the whole process (one per interval)
+        self._login_limiter = (
+            AsyncLimiter(1, Config.LOGIN_INTERVAL_SECONDS)
+            if AsyncLimiter is not None
+            else None
+        )
+
+        # Last Cloudflare bypass probe as (monotonic_ts, result), reused
+        # briefly so repeated /testlogin calls don't re-hit Cloudflare
+        self._cf_probe_cache: Optional[tuple] = None
+        self._cf_probe_ttl = 30.0
+
+        # Recent /search results as keyword -> (monotonic_ts, tweets); the
+        # oldest entry is evicted once the dict grows past the size cap
+        self._search_cache: Dict[str, tuple] = {}
+        self._search_cache_ttl = 60.0
+        self._search_cache_size = 256
+
+        # Last check_system_status report as (monotonic_ts, text), so
+        # repeated Refresh Status taps don't re-run every probe
+        self._status_cache: Optional[tuple] = None
+        self._status_cache_ttl = 3.0
+
+        # aiohttp session for the webhook health probe, opened on first use
+        self._http = None
+
+        # Twikit Client kwargs that only depend on config, keyed by use_proxy
+        self._twikit_kwargs_cache: Dict[bool, Dict[str, Any]] = {}
+
+        # System status; main() waits on shutdown_event, set by stop_system
+        # or by restart_bot (which also sets restart_requested)
         self.is_running = False
+        self.shutdown_event = asyncio.Event()
+        self.restart_requested = False
 
     def setup_handlers(self):
         """Setup Telegram command handlers"""
 
         # Command handlers
-        self.application.add_handler(CommandHandler("start", self.start_command))
-        self.application.add_handler(CommandHandler("help", self.help_command))
-        self.application.add_handler(CommandHandler("status", self.status_command))
-        self.application.add_handler(CommandHandler("logs", self.logs_command))
+        for command, method_name in self._COMMANDS:
+            self.application.add_handler(
+                CommandHandler(
+                    command,
+                    getattr(self, method_name),
+                    block=command not in self._NON_BLOCKING_COMMANDS,
+                )
+            )
 
-        # Bot management commands
-        self.application.add_handler(CommandHandler("addbot", self.addbot_command))
-        self.application.add_handler(
-            CommandHandler("addbotjson", self.addbotjson_command)
-        )
-        self.application.add_handler(
-            CommandHandler("addbotlogin", self.addbotlogin_command)
-        )
+        # File upload handler for cookie files
         self.application.add_handler(
-            CommandHandler("removebot", self.removebot_command)
+            MessageHandler(_JSON_DOC_FILTER, self.handle_cookie_upload)
         )
-        self.application.add_handler(CommandHandler("listbots", self.listbots_command))
+
+        # Callback query handler for inline keyboards. Button handlers post
+        # their progress text first, then run (status probes, git pull,
+        # systemctl) without holding up other updates
         self.application.add_handler(
-            CommandHandler("syncfollows", self.syncfollows_command)
+            CallbackQueryHandler(self.handle_callback_query, block=False)
         )
 
-        # Engagement commands
-        self.application.add_handler(CommandHandler("post", self.post_command))
-        self.application.add_handler(CommandHandler("quote", self.quote_command))
-        self.application.add_handler(CommandHandler("like", self.like_command))
-        self.application.add_handler(CommandHandler("retweet", self.retweet_command))
-        self.application.add_handler(CommandHandler("comment", self.comment_command))
-        self.application.add_handler(CommandHandler("unfollow", self.unfollow_command))
+    def _twikit_client_kwargs(self, use_proxy: bool) -> Dict[str, Any]:
+        """Build the static Twikit Client kwargs (cached per proxy setting)"""
+        if use_proxy in self._twikit_kwargs_cache:
+            return self._twikit_kwargs_cache[use_proxy]
 
-        # Search and pool management
-        self.application.add_handler(CommandHandler("search", self.search_command))
-        self.application.add_handler(CommandHandler("pool", self.pool_command))
-        self.application.add_handler(CommandHandler("refresh", self.refresh_command))
-
-        # System commands
-        self.application.add_handler(CommandHandler("stats", self.stats_command))
-        self.application.add_handler(CommandHandler("queue", self.queue_command))
-        self.application.add_handler(CommandHandler("backup", self.backup_command))
-        self.application.add_handler(CommandHandler("test", self.test_command))
-        self.application.add_handler(CommandHandler("reinit", self.reinit_command))
-        self.application.add_handler(CommandHandler("version", self.version_command))
-        self.application.add_handler(
-            CommandHandler("testlogin", self.testlogin_command)
-        )
-        self.application.add_handler(
-            CommandHandler("captchastatus", self.captchastatus_command)
-        )
-        self.application.add_handler(
-            CommandHandler("cloudflare", self.cloudflare_command)
-        )
-        self.application.add_handler(
-            CommandHandler("reactivate", self.reactivate_command)
-        )
-        self.application.add_handler(
-            CommandHandler("checkduplicates", self.checkduplicates_command)
-        )
-        self.application.add_handler(CommandHandler("cleanup", self.cleanup_command))
+        # Get proxy configuration
+        proxy_url = Config.PROXY_URL if use_proxy else None
+        params = _CLIENT_PARAMS
 
-        # Bot management commands
-        self.application.add_handler(CommandHandler("disable", self.disable_command))
-        self.application.add_handler(CommandHandler("enable", self.enable_command))
-        self.application.add_handler(CommandHandler("delete", self.delete_command))
-        self.application.add_handler(
-            CommandHandler("savecookies", self.savecookies_command)
-        )
+        # Build client kwargs
+        client_kwargs = {
+            'language': 'en-US'
+        }
 
-        # File upload handler for cookie files
-        self.application.add_handler(
-            MessageHandler(
-                filters.Document.MimeType("application/json"), self.handle_cookie_upload
-            )
-        )
+        # Add proxy if supported and configured
+        if 'proxy' in params and proxy_url:
+            client_kwargs['proxy'] = proxy_url
+            self.logger.info(f"Using proxy: {proxy_url[:50]}...")
 
-        # Text message handler for deletion confirmation
-        self.application.add_handler(
-            MessageHandler(
-                filters.TEXT & ~filters.COMMAND, self.handle_deletion_confirmation
-            )
-        )
+            # For residential proxies with SSL certificate issues, configure SSL settings
+            # This is necessary because residential proxies often use self-signed certificates
+            if 'httpx_kwargs' in params:
+                # Check if we have a custom SSL certificate for the proxy
+                cert_path = Config.PROXY_SSL_CERT
+                if cert_path and os.path.exists(cert_path):
+                    # Use the SSL certificate (e.g., Bright Data certificate)
+                    client_kwargs['httpx_kwargs'] = {
+                        'verify': cert_path
+                    }
+                    self.logger.info(f"Using SSL certificate: {cert_path}")
+                else:
+                    # Use config setting
+                    client_kwargs['httpx_kwargs'] = {
+                        'verify': Config.PROXY_SSL_VERIFY
+                    }
+                    if not Config.PROXY_SSL_VERIFY:
+                        self.logger.info("SSL verification disabled for proxy")
+                    else:
+                        self.logger.info("SSL verification enabled for proxy")
 
-        # Callback query handler for inline keyboards
-        self.application.add_handler(CallbackQueryHandler(self.handle_callback_query))
+        self._twikit_kwargs_cache[use_proxy] = client_kwargs
+        return client_kwargs
 
-        # Update and restart commands
-        self.application.add_handler(CommandHandler("update", self.update_command))
-        self.application.add_handler(CommandHandler("restart", self.restart_command))
-        
-        # Admin management commands
-        self.application.add_handler(CommandHandler("addadmin", self.addadmin_command))
-        self.application.add_handler(CommandHandler("removeadmin", self.removeadmin_command))
-        self.application.add_handler(CommandHandler("listadmins", self.listadmins_command))
+    async def _probe_cloudflare_bypass(self) -> Dict[str, Any]:
+        """Run the Cloudflare bypass test, reusing a result under 30s old"""
+        now = time.monotonic()
+        if self._cf_probe_cache and now - self._cf_probe_cache[0] < self._cf_probe_ttl:
+            return self._cf_probe_cache[1]
+
+        result = await captcha_solver.test_cloudflare_bypass()
+        self._cf_probe_cache = (now, result)
+        return result
+
+    async def _wait_for_login_slot(self):
+        """Wait until another Twitter login is allowed"""
+        if self._login_limiter is not None:
+            await self._login_limiter.acquire()
+        else:
+            # Add delay to appear more human-like
+            await asyncio.sleep(random.uniform(2, 5))
 
     def _create_twikit_client(self, use_proxy=True):
         """
@@ -157,196 +864,53 @@ class TwitterBotTelegram:
         Returns:
             Configured Client instance
         """
-        from twikit import Client
-        import inspect
+        client_kwargs = dict(self._twikit_client_kwargs(use_proxy))
 
-        # Get proxy configuration
-        proxy_url = Config.PROXY_URL if use_proxy else None
-
-        # Get captcha solver if available
-        captcha_solver_instance = None
-        if Config.USE_CAPTCHA_SOLVER and Config.CAPSOLVER_API_KEY:
-            try:
-                from twikit._captcha.capsolver import Capsolver as TwikitCapsolver
-                captcha_solver_instance = TwikitCapsolver(
+        # Each client gets its own captcha solver - Twikit binds it to the client
+        if 'captcha_solver' in _CLIENT_PARAMS and Config.USE_CAPTCHA_SOLVER and Config.CAPSOLVER_API_KEY:
+            if TwikitCapsolver is not None:
+                client_kwargs['captcha_solver'] = TwikitCapsolver(
                     api_key=Config.CAPSOLVER_API_KEY,
                     max_attempts=Config.CAPSOLVER_MAX_ATTEMPTS,
                     get_result_interval=Config.CAPSOLVER_RESULT_INTERVAL,
                 )
-            except ImportError:
+                self.logger.info("Captcha solver configured")
+            else:
                 self.logger.warning("Twikit Capsolver not available")
 
-        # Detect supported Client parameters
-        client_sig = inspect.signature(Client.__init__)
-        params = client_sig.parameters
-
-        # Build client kwargs
-        client_kwargs = {
-            'language': 'en-US'
-        }
-
-        # Add proxy if supported and configured
-        if 'proxy' in params and proxy_url:
-            client_kwargs['proxy'] = proxy_url
-            self.logger.info(f"Using proxy: {proxy_url[:50]}...")
-
-            # For residential proxies with SSL certificate issues, configure SSL settings
-            # This is necessary because residential proxies often use self-signed certificates
-            try:
-                import ssl
-
-                # Check if httpx_kwargs parameter is supported
-                if 'httpx_kwargs' in params:
-                    # Check if we have a custom SSL certificate for the proxy
-                    cert_path = Config.PROXY_SSL_CERT
-                    if cert_path and os.path.exists(cert_path):
-                        # Use the SSL certificate (e.g., Bright Data certificate)
-                        client_kwargs['httpx_kwargs'] = {
-                            'verify': cert_path
-                        }
-                        self.logger.info(f"Using SSL certificate: {cert_path}")
-                    else:
-                        # Use config setting
-                        client_kwargs['httpx_kwargs'] = {
-                            'verify': Config.PROXY_SSL_VERIFY
-                        }
-                        if not Config.PROXY_SSL_VERIFY:
-                            self.logger.info("SSL verification disabled for proxy")
-                        else:
-                            self.logger.info("SSL verification enabled for proxy")
-
-            except ImportError:
-                self.logger.warning("Could not configure SSL settings")
-
-        # Add captcha solver if supported and configured
-        if 'captcha_solver' in params and captcha_solver_instance:
-            client_kwargs['captcha_solver'] = captcha_solver_instance
-            self.logger.info("Captcha solver configured")
-
         # Create client
         try:
-            client = Client(**client_kwargs)
+            client = twikit.Client(**client_kwargs)
             return client
         except Exception as e:
             self.logger.error(f"Failed to create Twikit client: {e}")
             # Fallback to basic client
-            return Client('en-US')
+            return twikit.Client('en-US')
 
+    @admin_required
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
-        welcome_text = """
-🤖 **Twitter Bot System**
-
-Welcome to your Twitter automation command center!
-
-Choose an action from the menu below:
-        """
-
-        # Create main menu keyboard
-        keyboard = [
-            [
-                InlineKeyboardButton("📊 Status", callback_data="menu_status"),
-                InlineKeyboardButton("🤖 Bot Management", callback_data="menu_bots"),
-            ],
-            [
-                InlineKeyboardButton("🎯 Engagement", callback_data="menu_engagement"),
-                InlineKeyboardButton("🔍 Search & Pools", callback_data="menu_search"),
-            ],
-            [
-                InlineKeyboardButton("📈 Statistics", callback_data="menu_stats"),
-                InlineKeyboardButton("⚙️ System", callback_data="menu_system"),
-            ],
-            [
-                InlineKeyboardButton("📋 Help", callback_data="menu_help"),
-                InlineKeyboardButton("📝 Logs", callback_data="menu_logs"),
-            ],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
         await update.message.reply_text(
-            welcome_text, reply_markup=reply_markup, parse_mode="Markdown"
+            _WELCOME_TEXT, reply_markup=self._main_menu_markup, parse_mode="Markdown"
         )
 
+    @admin_required
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
-        help_text = """
-📖 Twitter Bot Commands Reference
-
-🤖 Bot Management:
-• `/addbot <cookie_file>` - Add new worker bot from uploaded cookie file
-• `/addbotjson <json_data>` - Add bot directly with JSON cookie data
-• `/addbotlogin <username> <password> [email]` - Add bot via username/password login
-• `/removebot <bot_id>` - Remove worker bot
-• `/disable <bot_id>` - Disable a bot (mark as inactive)
-• `/enable <bot_id>` - Enable a disabled bot
-• `/delete <bot_id>` - Permanently delete a bot
-• `/listbots` - List all worker bots and their status
-• `/syncfollows` - Sync mutual following between all bots
-
-⚙️ System Management:
-• `/update` - Interactive update menu (update & restart, restart only, restart system, check status)
-• `/restart` - Restart bot without updating code
-
-👥 Admin Management:
-• `/addadmin <user_id>` - Add a new admin (get ID from @userinfobot)
-• `/removeadmin <user_id>` - Remove an admin
-• `/listadmins` - Show all admins
-
-🎯 Engagement Commands:
-• `/post <url>` - Like, comment, and retweet a specific post
-• `/like <url>` - Like a specific post
-• `/retweet <url>` - Retweet a specific post
-• `/comment <url> "<text>"` - Comment on a specific post
-• `/quote <keyword> "<message>"` - Quote tweets containing keyword with mentions
-• `/unfollow <bot_id>` - Unfollow all followers for a specific bot
-• `/unfollow all` - Unfollow all followers for all bots
-
-🔍 Search & Pools:
-• `/search <keyword>` - Search for tweets with keyword
-• `/pool <keyword>` - Show user pool status for keyword
-• `/refresh <keyword>` - Refresh user pool for keyword
-
-📊 Monitoring:
-• `/status` - Show system status and bot health
-• `/stats` - Show engagement statistics
-• `/queue` - Show task queue status
-• `/logs` - View recent system logs
-• `/backup` - Create database backup
-
-💡 Tips:
-• Upload cookie files as JSON documents
-• Use quotes around messages with spaces
-• Check `/status` regularly for bot health
-• Monitor `/logs` for errors and notifications
-        """
-
-        await update.message.reply_text(help_text)
+        await update.message.reply_text(_HELP_TEXT)
 
+    @admin_required
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /status command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
-            # Get worker status
+            # Statistics read the DB file, which is only safe on the event
+            # loop thread - Database has no lock and rewrites the file in place
             worker_status = self.worker_manager.get_all_worker_statuses()
-
-            # Get queue status
             queue_status = await self.scheduler.get_queue_status()
-
-            # Get statistics
             stats = self.engagement_engine.get_engagement_stats()
 
-            status_text = f"""📊 System Status
+            parts = [
+                f"""📊 System Status
 
 🤖 Workers: {len(worker_status)} bots
 📋 Queue: {queue_status["pending_tasks"]} pending, {queue_status["in_progress_tasks"]} in progress
@@ -357,6 +921,7 @@ Choose an action from the menu below:
 
 Bot Status:
 """
+            ]
 
             for bot_id, status in worker_status.items():
                 status_indicator = "✅" if status["can_perform_action"] else "❌"
@@ -366,23 +931,20 @@ Bot Status:
                 elif status["captcha_required"]:
                     rate_limit = " (Captcha Required)"
 
-                status_text += f"{status_indicator} {bot_id}{rate_limit}\n"
+                parts.append(f"{status_indicator} {bot_id}{rate_limit}\n")
 
-            status_text += (
-                f"\n📅 Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            parts.append(
+                f"\n📅 Last Updated: {datetime.now().isoformat(sep=' ', timespec='seconds')}"
             )
 
-            await update.message.reply_text(status_text)
+            await update.message.reply_text("".join(parts), parse_mode=None)
 
         except Exception as e:
             await update.message.reply_text(f"❌ Error getting status: {str(e)}")
 
+    @admin_required
     async def addbot_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /addbot command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide a cookie file name.\n"
@@ -394,16 +956,15 @@ Bot Status:
         cookie_filename = context.args[0]
         cookie_path = os.path.join(Config.COOKIES_PATH, cookie_filename)
 
-        if not os.path.exists(cookie_path):
-            await update.message.reply_text(
-                f"❌ Cookie file not found: {cookie_filename}"
-            )
-            return
-
         try:
-            # Load cookie data
-            with open(cookie_path, "r") as f:
-                cookie_data = json.load(f)
+            # Load cookie data (file I/O runs off the event loop)
+            try:
+                cookie_data = await asyncio.to_thread(_read_json_file, cookie_path)
+            except FileNotFoundError:
+                await update.message.reply_text(
+                    f"❌ Cookie file not found: {cookie_filename}"
+                )
+                return
 
             # Ensure cookies are processed (in case file wasn't processed during upload)
             processed_cookies = self._process_raw_cookies(cookie_data)
@@ -414,7 +975,7 @@ Bot Status:
                 return
 
             # Generate bot ID
-            bot_id = f"bot_{len(self.worker_manager.get_all_workers()) + 1}"
+            bot_id = await self.worker_manager.allocate_bot_id()
 
             # Add worker with processed cookies
             success = await self.worker_manager.add_worker(bot_id, processed_cookies)
@@ -432,14 +993,11 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error adding bot: {str(e)}")
 
+    @admin_required
     async def addbotjson_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /addbotjson command - add bot directly with JSON data"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide JSON cookie data.\n"
@@ -458,7 +1016,7 @@ Bot Status:
             json_text = " ".join(context.args)
 
             # Parse the JSON
-            raw_cookie_data = json.loads(json_text)
+            raw_cookie_data = _loads_json(json_text)
 
             # Process cookies
             processed_cookies = self._process_raw_cookies(raw_cookie_data)
@@ -466,49 +1024,16 @@ Bot Status:
                 await update.message.reply_text("❌ Failed to process cookie data")
                 return
 
-            # Enhanced validation with token mismatch detection
-            from cookie_processor import CookieProcessor
-
-            validation = CookieProcessor.validate_cookies(processed_cookies)
-
-            if not validation["valid"]:
-                error_message = "❌ Invalid cookie data!\n\n"
-
-                if validation["missing"]:
-                    error_message += f"Missing required cookies: {', '.join(validation['missing'])}\n\n"
-
-                if validation["errors"]:
-                    error_message += f"Critical errors:\n"
-                    for error in validation["errors"]:
-                        error_message += f"• {error}\n"
-                    error_message += "\n"
-
-                if validation["warnings"]:
-                    error_message += "Warnings:\n"
-                    for warning in validation["warnings"]:
-                        error_message += f"• {warning}\n"
-
+            # Validate and reject cookies already used by another bot
+            validation, error_message = self._check_new_cookies(
+                processed_cookies, "cookie data"
+            )
+            if error_message:
                 await update.message.reply_text(error_message)
                 return
 
-            # Check for duplicate cookies (same auth_token)
-            if "auth_token" in processed_cookies:
-                auth_token = processed_cookies["auth_token"]
-                existing_bots = self.db.get_all_bots()
-
-                for bot_id, bot_info in existing_bots.items():
-                    existing_cookies = bot_info.get("cookie_data", {})
-                    if existing_cookies.get("auth_token") == auth_token:
-                        await update.message.reply_text(
-                            f"❌ Duplicate cookie data detected!\n\n"
-                            f"This auth_token is already used by bot: `{bot_id}`\n\n"
-                            f"Each bot must have unique authentication cookies.\n"
-                            f"Please export fresh cookies from a different account or remove the existing bot first."
-                        )
-                        return
-
             # Generate bot ID
-            bot_id = f"bot_{len(self.worker_manager.get_all_workers()) + 1}"
+            bot_id = await self.worker_manager.allocate_bot_id()
 
             # Add worker
             success = await self.worker_manager.add_worker(bot_id, processed_cookies)
@@ -541,78 +1066,69 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error adding bot: {str(e)}")
 
+    @admin_required
     async def addbotlogin_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /addbotlogin command for username/password login"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args or len(context.args) < 2:
-            await update.message.reply_text(
-                "❌ Please provide username and password.\n"
-                "Usage: `/addbotlogin <username> <password> [email]`\n\n"
-                "Example:\n"
-                "`/addbotlogin myusername mypassword123`\n"
-                "`/addbotlogin myusername mypassword123 email@example.com`\n\n"
-                "Note: This will automatically save cookies after successful login."
-            )
+            await update.message.reply_text(_USAGE_ADDBOTLOGIN)
             return
 
         username = str(context.args[0])
         password = str(context.args[1])
         email = str(context.args[2]) if len(context.args) > 2 else ""
 
-        try:
-            await update.message.reply_text(
+        # Send the progress note in the background - the login below takes
+        # seconds, so it doesn't need to wait for Telegram's round trip
+        progress_reply = asyncio.create_task(
+            update.message.reply_text(
                 f"🔐 Attempting to login with username: {username}\n"
                 "This may take a few moments...\n"
                 "🔌 Using residential proxy for authentication"
             )
+        )
 
+        try:
             # Generate bot ID
-            bot_id = f"bot_{len(self.worker_manager.get_all_workers()) + 1}"
+            bot_id = await self.worker_manager.allocate_bot_id()
 
             # Create cookie file path
-            cookie_file_path = os.path.join(
-                Config.COOKIES_PATH, f"{bot_id}_cookies.json"
-            )
-            os.makedirs(os.path.dirname(cookie_file_path), exist_ok=True)
+            cookie_file_path = _cookie_file_path(bot_id)
 
             # Create client with proxy support
             temp_client = self._create_twikit_client(use_proxy=True)
 
-            # Add delay to appear more human-like
-            import random
-            await asyncio.sleep(random.uniform(2, 5))
-
             # Check if cookies_file parameter is supported
-            import inspect
-            login_signature = inspect.signature(temp_client.login)
-            cookies_file_supported = "cookies_file" in login_signature.parameters
+            cookies_file_supported = "cookies_file" in _LOGIN_PARAMS
 
-            # Attempt login with username/password
+            # Attempt login with username/password (limited to a few at once
+            # so parallel /addbotlogin calls don't trip Cloudflare)
             try:
-                if cookies_file_supported:
-                    login_result = await temp_client.login(
-                        auth_info_1=username,
-                        auth_info_2=email,  # Optional email
-                        password=password,
-                        cookies_file=cookie_file_path,  # Auto-save cookies to file
-                    )
-                else:
-                    # Fallback for older twikit versions
-                    login_result = await temp_client.login(
-                        auth_info_1=username,
-                        auth_info_2=email,  # Optional email
-                        password=password,
-                    )
+                async with self._login_semaphore:
+                    await self._wait_for_login_slot()
+                    if cookies_file_supported:
+                        login_result = await temp_client.login(
+                            auth_info_1=username,
+                            auth_info_2=email,  # Optional email
+                            password=password,
+                            cookies_file=cookie_file_path,  # Auto-save cookies to file
+                        )
+                    else:
+                        # Fallback for older twikit versions
+                        login_result = await temp_client.login(
+                            auth_info_1=username,
+                            auth_info_2=email,  # Optional email
+                            password=password,
+                        )
             except Exception as e:
                 # Surface deeper diagnostics in logs
                 self.logger.error(f"Login request failed: {type(e).__name__}: {str(e)}")
                 raise
 
+            # Keep the progress note ahead of any result reply
+            await asyncio.gather(progress_reply, return_exceptions=True)
+
             # Check if login was successful
             if login_result:
                 # Get cookies from the logged-in client
@@ -632,35 +1148,27 @@ Bot Status:
                     except Exception as e:
                         self.logger.warning(f"Failed to save cookies to file: {e}")
 
-                # Add bot to database
-                success = self.db.add_bot(bot_id, cookies)
-
-                if success:
-                    # Initialize worker
-                    worker_success = await self.worker_manager.add_bot(bot_id, cookies)
-
-                    if worker_success:
-                        cookie_save_method = "automatically" if cookies_file_supported else "manually"
-                        await update.message.reply_text(
-                            f"✅ Bot {bot_id} added successfully via login!\n"
-                            f"👤 Username: {username}\n"
-                            f"💾 Cookies saved to: {cookie_file_path} ({cookie_save_method})\n"
-                            f"🔌 Proxy: {'Configured' if Config.PROXY_URL else 'Not configured'}\n"
-                            f"Bot is now active and ready to use!"
-                        )
+                # Add bot to database and initialize its worker (one DB write)
+                worker_success = await self.worker_manager.add_worker(bot_id, cookies)
 
-                        # Schedule mutual following sync
-                        await self.scheduler.add_task(
-                            TaskType.SYNC_FOLLOWS, {"new_bot_id": bot_id}, priority=2
-                        )
-                    else:
-                        await update.message.reply_text(
-                            f"❌ Bot {bot_id} added to database but failed to initialize.\n"
-                            "Check logs for details."
-                        )
+                if worker_success:
+                    cookie_save_method = "automatically" if cookies_file_supported else "manually"
+                    await update.message.reply_text(
+                        f"✅ Bot {bot_id} added successfully via login!\n"
+                        f"👤 Username: {username}\n"
+                        f"💾 Cookies saved to: {cookie_file_path} ({cookie_save_method})\n"
+                        f"🔌 Proxy: {'Configured' if Config.PROXY_URL else 'Not configured'}\n"
+                        f"Bot is now active and ready to use!"
+                    )
+
+                    # Schedule mutual following sync
+                    await self.scheduler.add_task(
+                        TaskType.SYNC_FOLLOWS, {"new_bot_id": bot_id}, priority=2
+                    )
                 else:
                     await update.message.reply_text(
-                        f"❌ Failed to add bot {bot_id} to database"
+                        f"❌ Failed to add or initialize bot {bot_id}.\n"
+                        "Check logs for details."
                     )
             else:
                 await update.message.reply_text(
@@ -669,6 +1177,9 @@ Bot Status:
                 )
 
         except Exception as e:
+            # Keep the progress note ahead of the error reply
+            await asyncio.gather(progress_reply, return_exceptions=True)
+
             error_msg = str(e)
             error_type = type(e).__name__
 
@@ -680,13 +1191,7 @@ Bot Status:
                 error_msg = error_msg[:1000] + "..."
 
             # Check for specific error types with better diagnostics
-            if (
-                "403" in error_msg
-                or "Cloudflare" in error_msg
-                or "blocked" in error_msg
-                or "ssl" in error_msg.lower()
-                or "certificate" in error_msg.lower()
-            ):
+            if _LOGIN_BLOCKED_RE.search(error_msg) or _SSL_ERROR_RE.search(error_msg):
                 # Check if SSL cert exists
                 cert_exists = os.path.exists(Config.PROXY_SSL_CERT) if Config.PROXY_SSL_CERT else False
 
@@ -728,119 +1233,67 @@ Bot Status:
                     "Use /addbotjson to add bots via cookies."
                 )
 
+    @admin_required
     async def handle_cookie_upload(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle cookie file uploads"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
             # Get file info
             file = await context.bot.get_file(update.message.document.file_id)
 
-            # Create cookies directory
-            os.makedirs(Config.COOKIES_PATH, exist_ok=True)
-
-            # Download file
             filename = update.message.document.file_name
             file_path = os.path.join(Config.COOKIES_PATH, filename)
 
-            await file.download_to_drive(file_path)
-
-            # Load and process JSON
-            with open(file_path, "r") as f:
-                raw_cookie_data = json.load(f)
+            # Parse the upload in memory; only the processed cookies are
+            # written to disk, and rejected files never touch it
+            raw_cookie_data = _loads_json(await file.download_as_bytearray())
 
             # Process cookies (handles both raw browser export and processed format)
             processed_cookies = self._process_raw_cookies(raw_cookie_data)
 
-            # Enhanced validation with token mismatch detection
-            from cookie_processor import CookieProcessor
-
-            validation = CookieProcessor.validate_cookies(processed_cookies)
-
-            if not validation["valid"]:
-                os.remove(file_path)
-
-                error_message = "❌ Invalid cookie file!\n\n"
-
-                if validation["missing"]:
-                    error_message += f"Missing required cookies: {', '.join(validation['missing'])}\n\n"
-
-                if validation["errors"]:
-                    error_message += f"Critical errors:\n"
-                    for error in validation["errors"]:
-                        error_message += f"• {error}\n"
-                    error_message += "\n"
-
-                if validation["warnings"]:
-                    error_message += "Warnings:\n"
-                    for warning in validation["warnings"]:
-                        error_message += f"• {warning}\n"
-
+            # Validate and reject cookies already used by another bot
+            validation, error_message = self._check_new_cookies(
+                processed_cookies, "cookie file"
+            )
+            if error_message:
                 await update.message.reply_text(error_message)
                 return
 
-            # Check for duplicate cookies (same auth_token)
-            if "auth_token" in processed_cookies:
-                auth_token = processed_cookies["auth_token"]
-                existing_bots = self.db.get_all_bots()
-
-                for bot_id, bot_info in existing_bots.items():
-                    existing_cookies = bot_info.get("cookie_data", {})
-                    if existing_cookies.get("auth_token") == auth_token:
-                        os.remove(file_path)
-                        await update.message.reply_text(
-                            f"❌ Duplicate cookie file detected!\n\n"
-                            f"This auth_token is already used by bot: `{bot_id}`\n\n"
-                            f"Each bot must have unique authentication cookies.\n"
-                            f"Please export fresh cookies from a different account or remove the existing bot first."
-                        )
-                        return
-
-            # Save processed cookies back to file
-            with open(file_path, "w") as f:
-                json.dump(processed_cookies, f, indent=2)
+            # Save the processed cookies for /addbot
+            await asyncio.to_thread(_write_json_file, file_path, processed_cookies)
 
             # Prepare success message with validation results
             cookie_count = len(processed_cookies)
-            success_message = f"✅ Cookie file processed successfully!\n\n"
-            success_message += f"🍪 Cookies Found: {cookie_count}\n"
-            success_message += (
-                f"✅ Required: {len(validation['present'])}/{len(['auth_token', 'ct0'])}\n"
-            )
+            parts = [
+                "✅ Cookie file processed successfully!\n\n",
+                f"🍪 Cookies Found: {cookie_count}\n",
+                f"✅ Required: {len(validation['present'])}/{len(_REQUIRED_COOKIE_FIELDS)}\n",
+            ]
 
             if validation["warnings"]:
-                success_message += f"\n⚠️ Warnings:\n"
-                for warning in validation["warnings"]:
-                    success_message += f"• {warning}\n"
+                parts.append("\n⚠️ Warnings:\n")
+                parts.extend(f"• {warning}\n" for warning in validation["warnings"])
 
-            success_message += (
-                f"\nUse `/addbot {filename}` to add this bot to the system."
-            )
+            parts.append(f"\nUse `/addbot {filename}` to add this bot to the system.")
 
-            await update.message.reply_text(success_message)
+            await update.message.reply_text("".join(parts))
 
         except Exception as e:
             await update.message.reply_text(f"❌ Error uploading cookie file: {str(e)}")
 
+    @admin_required
     async def testlogin_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /testlogin command to test if login is blocked"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
             await update.message.reply_text("🔍 Testing login connectivity...")
 
             # Test Cloudflare bypass first
             if captcha_solver.is_cloudscraper_available():
                 await update.message.reply_text("🌐 Testing Cloudflare bypass...")
-                cloudflare_result = await captcha_solver.test_cloudflare_bypass()
+                cloudflare_result = await self._probe_cloudflare_bypass()
 
                 if cloudflare_result["success"]:
                     await update.message.reply_text(
@@ -874,7 +1327,7 @@ Bot Status:
             temp_client = self._create_twikit_client(use_proxy=True)
 
             # Try a simple request to test connectivity
-            await asyncio.sleep(2)
+            await self._wait_for_login_slot()
 
             # This will fail but we can see what type of error we get
             try:
@@ -885,22 +1338,14 @@ Bot Status:
                 )
             except Exception as e:
                 error_msg = str(e)
-                if (
-                    "403" in error_msg
-                    or "Cloudflare" in error_msg
-                    or "blocked" in error_msg
-                ):
-                    status_text = (
-                        "❌ Login is BLOCKED by Cloudflare\n\n"
-                        "🔧 Solutions:\n"
-                        "1. ✅ Use cookie upload method: `/addbot` or `/addbotjson`\n"
-                        "2. Enable captcha solver: Set `USE_CAPTCHA_SOLVER=true`\n"
-                        "3. Enable cloudscraper: Set `USE_CLOUDSCRAPER=true`\n"
-                        "4. Configure residential proxy (currently: " + 
-                        ('✅ configured' if Config.PROXY_URL else '❌ not configured') + ")\n\n"
-                        "💡 Run `/captchastatus` for detailed status"
+                if _LOGIN_BLOCKED_RE.search(error_msg):
+                    await update.message.reply_text(
+                        _CF_BLOCKED_HELP.format(
+                            proxy_status="✅ configured"
+                            if Config.PROXY_URL
+                            else "❌ not configured"
+                        )
                     )
-                    await update.message.reply_text(status_text)
                 else:
                     await update.message.reply_text(
                         f"✅ Login connectivity OK\n"
@@ -911,19 +1356,13 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Test failed: {str(e)}")
 
+    @admin_required
     async def captchastatus_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /captchastatus command to show captcha solver status"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
             # Build live status using a fresh CaptchaSolver instance
-            from captcha_solver import CaptchaSolver
-            from config import Config
-
             solver = CaptchaSolver()
 
             captcha_enabled = Config.USE_CAPTCHA_SOLVER
@@ -935,40 +1374,37 @@ Bot Status:
 
             proxy_configured = bool(Config.PROXY_URL)
 
-            status_text = "🧩 Captcha Solver & Proxy Status\n\n"
-            status_text += "🔧 Captcha Solver:\n"
-            status_text += f"   Enabled: {'✅' if captcha_enabled else '❌'}\n"
-            status_text += f"   Configured: {'✅' if captcha_configured else '❌'}\n"
-            status_text += f"   Available: {'✅' if captcha_available else '❌'}\n\n"
-
-            status_text += "🌐 Cloudscraper:\n"
-            status_text += f"   Enabled: {'✅' if cf_enabled else '❌'}\n"
-            status_text += f"   Available: {'✅' if cf_available else '❌'}\n\n"
-
-            status_text += "🔌 Residential Proxy:\n"
-            status_text += f"   Configured: {'✅' if proxy_configured else '❌'}\n"
+            parts = [
+                "🧩 Captcha Solver & Proxy Status\n\n",
+                "🔧 Captcha Solver:\n",
+                f"   Enabled: {'✅' if captcha_enabled else '❌'}\n",
+                f"   Configured: {'✅' if captcha_configured else '❌'}\n",
+                f"   Available: {'✅' if captcha_available else '❌'}\n\n",
+                "🌐 Cloudscraper:\n",
+                f"   Enabled: {'✅' if cf_enabled else '❌'}\n",
+                f"   Available: {'✅' if cf_available else '❌'}\n\n",
+                "🔌 Residential Proxy:\n",
+                f"   Configured: {'✅' if proxy_configured else '❌'}\n",
+            ]
             if proxy_configured:
                 proxy_preview = Config.PROXY_URL[:50] + "..." if len(Config.PROXY_URL) > 50 else Config.PROXY_URL
-                status_text += f"   URL: {proxy_preview}\n\n"
+                parts.append(f"   URL: {proxy_preview}\n\n")
 
-            status_text += (
+            parts.append(
                 "✅ All systems configured properly!"
                 if (proxy_configured and (captcha_enabled and captcha_configured or cf_enabled))
                 else "⚠️ Some components are not available. Recommended: Configure residential proxy."
             )
 
-            await update.message.reply_text(status_text)
+            await update.message.reply_text("".join(parts))
 
         except Exception as e:
             await update.message.reply_text(f"❌ Error getting status: {str(e)}")
 
     # Remaining command handlers from original file
+    @admin_required
     async def post_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /post command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide a Twitter URL.\n"
@@ -979,29 +1415,27 @@ Bot Status:
         url = context.args[0]
 
         try:
-            # Add engagement tasks
-            tasks_added = []
-
-            # Like task
-            task_id = await self.scheduler.add_task(TaskType.LIKE, {"tweet_url": url})
-            tasks_added.append(f"Like: {task_id}")
-
-            # Comment task (with delay)
-            task_id = await self.scheduler.add_task(
-                TaskType.COMMENT,
-                {
-                    "tweet_url": url,
-                    "comments": ["Nice post! 👍", "Great content! 🎯", "Amazing! ✨"],
-                },
-                delay_minutes=5,
-            )
-            tasks_added.append(f"Comment: {task_id}")
-
-            # Retweet task (with delay)
-            task_id = await self.scheduler.add_task(
-                TaskType.RETWEET, {"tweet_url": url}, delay_minutes=10
+            # Submit like, comment (+5 min) and retweet (+10 min) together so
+            # the scheduler persists them in one batch
+            like_id, comment_id, retweet_id = await asyncio.gather(
+                self.scheduler.add_task(TaskType.LIKE, {"tweet_url": url}),
+                self.scheduler.add_task(
+                    TaskType.COMMENT,
+                    {
+                        "tweet_url": url,
+                        "comments": ["Nice post! 👍", "Great content! 🎯", "Amazing! ✨"],
+                    },
+                    delay_minutes=5,
+                ),
+                self.scheduler.add_task(
+                    TaskType.RETWEET, {"tweet_url": url}, delay_minutes=10
+                ),
             )
-            tasks_added.append(f"Retweet: {task_id}")
+            tasks_added = [
+                f"Like: {like_id}",
+                f"Comment: {comment_id}",
+                f"Retweet: {retweet_id}",
+            ]
 
             await update.message.reply_text(
                 f"✅ Post engagement scheduled!\n\n"
@@ -1014,6 +1448,7 @@ Bot Status:
                 f"❌ Error scheduling post engagement: {str(e)}"
             )
 
+    @admin_required
     async def quote_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """
         Handle /quote command
@@ -1027,10 +1462,6 @@ Bot Status:
         5. Continues until 100 unique users mentioned
         6. Auto-fetches more tweets if needed
         """
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if len(context.args) < 2:
             await update.message.reply_text(
                 "❌ Please provide keyword and tweet URL.\n"
@@ -1079,14 +1510,11 @@ Bot Status:
                 f"❌ Error scheduling quote campaign: {str(e)}"
             )
 
+    @admin_required
     async def listbots_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /listbots command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
             workers = self.worker_manager.get_all_workers()
             worker_status = self.worker_manager.get_all_worker_statuses()
@@ -1097,34 +1525,33 @@ Bot Status:
                 )
                 return
 
-            text = "🤖 Configured Bots:\n\n"
+            parts = ["🤖 Configured Bots:\n\n"]
 
-            for bot_id, worker in workers.items():
-                status = worker_status.get(bot_id, {})
+            # get_all_workers() returns a list; statuses are keyed by bot_id
+            for bot_id, status in worker_status.items():
                 emoji = "✅" if status.get("can_perform_action") else "❌"
 
-                text += f"{emoji} {bot_id}\n"
-                text += f"   Status: {status.get('status', 'unknown')}\n"
+                parts.append(f"{emoji} {bot_id}\n")
+                parts.append(f"   Status: {status.get('status', 'unknown')}\n")
 
                 if status.get("rate_limited_until"):
-                    text += f"   Rate Limited Until: {status['rate_limited_until']}\n"
+                    parts.append(
+                        f"   Rate Limited Until: {status['rate_limited_until']}\n"
+                    )
 
                 if status.get("captcha_required"):
-                    text += f"   ⚠️ Captcha Required\n"
+                    parts.append("   ⚠️ Captcha Required\n")
 
-                text += "\n"
+                parts.append("\n")
 
-            await update.message.reply_text(text)
+            await update.message.reply_text("".join(parts), parse_mode=None)
 
         except Exception as e:
             await update.message.reply_text(f"❌ Error listing bots: {str(e)}")
 
+    @admin_required
     async def logs_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /logs command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
             lines = 20
             if context.args:
@@ -1144,72 +1571,68 @@ Bot Status:
             if len(logs) > 4000:
                 logs = logs[-4000:]  # Take last 4000 characters
 
+            # Plain text: log lines often contain Markdown control characters
             await update.message.reply_text(
-                f"📝 Recent Logs:\n\n```\n{logs}\n```",
+                f"📝 Recent Logs:\n\n{logs}", parse_mode=None
             )
 
         except Exception as e:
             await update.message.reply_text(f"❌ Error getting logs: {str(e)}")
 
+    @admin_required
     async def stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /stats command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
             stats = self.engagement_engine.get_engagement_stats()
             db_stats = stats.get("database_stats", {})
 
-            text = "📈 Engagement Statistics\n\n"
+            parts = ["📈 Engagement Statistics\n\n"]
 
             if isinstance(db_stats, dict):
-                text += f"👍 Likes: {db_stats.get('total_likes', 0)}\n"
-                text += f"💬 Comments: {db_stats.get('total_comments', 0)}\n"
-                text += f"🔄 Retweets: {db_stats.get('total_retweets', 0)}\n"
-                text += f"💭 Quotes: {db_stats.get('total_quotes', 0)}\n"
+                parts.append(f"👍 Likes: {db_stats.get('total_likes', 0)}\n")
+                parts.append(f"💬 Comments: {db_stats.get('total_comments', 0)}\n")
+                parts.append(f"🔄 Retweets: {db_stats.get('total_retweets', 0)}\n")
+                parts.append(f"💭 Quotes: {db_stats.get('total_quotes', 0)}\n")
 
-            text += (
-                f"\n🤖 Active Workers: {len(self.worker_manager.get_active_workers())}\n"
+            parts.append(
+                f"\n🤖 Active Workers: {self.worker_manager.get_active_worker_count()}\n"
+            )
+            parts.append(
+                f"📅 Last Updated: {datetime.now().isoformat(sep=' ', timespec='seconds')}"
             )
-            text += f"📅 Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
-            await update.message.reply_text(text)
+            await update.message.reply_text("".join(parts), parse_mode=None)
 
         except Exception as e:
             await update.message.reply_text(f"❌ Error getting statistics: {str(e)}")
 
+    @admin_required
     async def queue_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /queue command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
             queue_status = await self.scheduler.get_queue_status()
 
-            text = "🔄 Task Queue Status\n\n"
-            text += f"📋 Queue Size: {queue_status['queue_size']}\n"
-            text += f"⏳ Pending: {queue_status['pending_tasks']}\n"
-            text += f"🔄 In Progress: {queue_status['in_progress_tasks']}\n"
-            text += f"✅ Completed: {queue_status['completed_tasks']}\n"
-            text += f"❌ Failed: {queue_status['failed_tasks']}\n"
-            text += f"📊 Total Active: {queue_status['active_tasks']}"
+            text = (
+                "🔄 Task Queue Status\n\n"
+                f"📋 Queue Size: {queue_status['queue_size']}\n"
+                f"⏳ Pending: {queue_status['pending_tasks']}\n"
+                f"🔄 In Progress: {queue_status['in_progress_tasks']}\n"
+                f"✅ Completed: {queue_status['completed_tasks']}\n"
+                f"❌ Failed: {queue_status['failed_tasks']}\n"
+                f"📊 Total Active: {queue_status['active_tasks']}"
+            )
 
-            await update.message.reply_text(text)
+            await update.message.reply_text(text, parse_mode=None)
 
         except Exception as e:
             await update.message.reply_text(f"❌ Error getting queue status: {str(e)}")
 
     # Additional helper methods and remaining command handlers
+    @admin_required
     async def removebot_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /removebot command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide bot ID.\nUsage: `/removebot <bot_id>`",
@@ -1224,14 +1647,11 @@ Bot Status:
         else:
             await update.message.reply_text(f"❌ Failed to remove bot {bot_id}")
 
+    @admin_required
     async def syncfollows_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /syncfollows command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         await update.message.reply_text("🔄 Syncing mutual follows...")
 
         task_id = await self.scheduler.add_task(TaskType.SYNC_FOLLOWS, {}, priority=2)
@@ -1242,24 +1662,21 @@ Bot Status:
 
     async def like_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /like command"""
-        await self._handle_single_action(update, context, TaskType.LIKE, "like")
+        await self._handle_single_action(update, context, "like")
 
     async def retweet_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /retweet command"""
-        await self._handle_single_action(update, context, TaskType.RETWEET, "retweet")
+        await self._handle_single_action(update, context, "retweet")
 
     async def comment_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /comment command"""
-        await self._handle_single_action(update, context, TaskType.COMMENT, "comment")
+        await self._handle_single_action(update, context, "comment")
 
+    @admin_required
     async def unfollow_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /unfollow command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide bot ID or 'all'.\n"
@@ -1287,8 +1704,9 @@ Bot Status:
                     await update.message.reply_text(f"❌ Error: {results['error']}")
                     return
 
-                # Format results
-                summary_text = "✅ Unfollow Process Completed\n\n"
+                # Format results - one block per bot, sent in as many
+                # messages as needed to stay under Telegram's size limit
+                summary_blocks = []
                 total_unfollowed = 0
                 total_failed = 0
 
@@ -1299,17 +1717,25 @@ Bot Status:
                         total_unfollowed += unfollowed
                         total_failed += failed
 
-                        summary_text += f"🤖 {bot_id}:\n"
-                        summary_text += f"  ✅ Unfollowed: {unfollowed}\n"
-                        summary_text += f"  ❌ Failed: {failed}\n\n"
+                        summary_blocks.append(
+                            f"🤖 {bot_id}:\n"
+                            f"  ✅ Unfollowed: {unfollowed}\n"
+                            f"  ❌ Failed: {failed}\n"
+                        )
                     else:
-                        summary_text += f"❌ {bot_id}: Error - {result.get('error', 'Unknown error')}\n\n"
+                        summary_blocks.append(
+                            f"❌ {bot_id}: Error - {result.get('error', 'Unknown error')}\n"
+                        )
 
-                summary_text += f"📊 Total Results:\n"
-                summary_text += f"  ✅ Total Unfollowed: {total_unfollowed}\n"
-                summary_text += f"  ❌ Total Failed: {total_failed}"
+                summary_blocks.append(
+                    f"📊 Total Results:\n"
+                    f"  ✅ Total Unfollowed: {total_unfollowed}\n"
+                    f"  ❌ Total Failed: {total_failed}"
+                )
 
-                await update.message.reply_text(summary_text)
+                await self._reply_chunked(
+                    update, "✅ Unfollow Process Completed\n\n", summary_blocks
+                )
 
             else:
                 # Unfollow for specific bot
@@ -1327,21 +1753,22 @@ Bot Status:
                     failed = result.get("failed", 0)
                     total = result.get("total_following", 0)
 
-                    response_text = f"✅ Unfollow Process Completed for {bot_id}\n\n"
-                    response_text += f"📊 Total Following: {total}\n"
-                    response_text += f"✅ Successfully Unfollowed: {unfollowed}\n"
-                    response_text += f"❌ Failed: {failed}\n"
-
-                    if result.get("errors"):
-                        response_text += f"\n❌ Errors:\n"
-                        for error in result["errors"][:5]:  # Show first 5 errors
-                            response_text += f"• {error}\n"
-                        if len(result["errors"]) > 5:
-                            response_text += (
-                                f"... and {len(result['errors']) - 5} more errors"
-                            )
-
-                    await update.message.reply_text(response_text)
+                    parts = [
+                        f"✅ Unfollow Process Completed for {bot_id}\n\n",
+                        f"📊 Total Following: {total}\n",
+                        f"✅ Successfully Unfollowed: {unfollowed}\n",
+                        f"❌ Failed: {failed}\n",
+                    ]
+
+                    errors = result.get("errors")
+                    if errors:
+                        parts.append("\n❌ Errors:\n")
+                        # Show first 5 errors
+                        parts.extend(f"• {error}\n" for error in errors[:5])
+                        if len(errors) > 5:
+                            parts.append(f"... and {len(errors) - 5} more errors")
+
+                    await update.message.reply_text("".join(parts))
                 else:
                     await update.message.reply_text(
                         f"❌ Error: {result.get('error', 'Unknown error')}"
@@ -1352,93 +1779,103 @@ Bot Status:
                 f"❌ Error executing unfollow command: {str(e)}"
             )
 
+    @admin_required
     async def search_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /search command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide keyword.\nUsage: `/search <keyword>`",
             )
             return
 
-        keyword = context.args[0]
+        # Key searches off the canonical form, echo what the admin typed
+        orig = context.args[0]
+        keyword = orig.strip().lower()
         await update.message.reply_text(
-            f"🔍 Searching for tweets with keyword: {keyword}"
+            f"🔍 Searching for tweets with keyword: {orig}"
         )
 
-        tweets = await self.search_engine.search_tweets_by_keyword(keyword)
+        tweets = await self._search_tweets_cached(keyword)
         await update.message.reply_text(
-            f"✅ Found {len(tweets)} tweets for keyword: {keyword}"
+            f"✅ Found {len(tweets)} tweets for keyword: {orig}"
         )
 
+    async def _search_tweets_cached(self, keyword: str) -> List[Any]:
+        """Search tweets for a keyword, reusing a result under 60s old"""
+        now = time.monotonic()
+        hit = self._search_cache.get(keyword)
+        if hit and now - hit[0] < self._search_cache_ttl:
+            return hit[1]
+
+        tweets = await self.search_engine.search_tweets_by_keyword(keyword)
+
+        # Re-insert so dict order stays oldest-first for eviction
+        self._search_cache.pop(keyword, None)
+        self._search_cache[keyword] = (now, tweets)
+        if len(self._search_cache) > self._search_cache_size:
+            del self._search_cache[next(iter(self._search_cache))]
+
+        return tweets
+
+    @admin_required
     async def pool_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /pool command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide keyword.\nUsage: `/pool <keyword>`",
             )
             return
 
-        keyword = context.args[0]
-        pool_status = self.search_engine.get_user_pool_status(keyword)
+        orig = context.args[0]
+        pool_status = self.search_engine.get_user_pool_status(orig.strip().lower())
 
         if not pool_status:
-            await update.message.reply_text(f"❌ No pool found for keyword: {keyword}")
+            await update.message.reply_text(f"❌ No pool found for keyword: {orig}")
             return
 
-        text = f"👥 User Pool: {keyword}\n\n"
-        text += f"✅ Available: {pool_status['available_users']}\n"
-        text += f"🔄 Used: {pool_status['used_users']}\n"
-        text += f"📊 Total: {pool_status['total_users']}\n"
+        parts = [
+            f"👥 User Pool: {orig}\n\n",
+            f"✅ Available: {pool_status['available_users']}\n",
+            f"🔄 Used: {pool_status['used_users']}\n",
+            f"📊 Total: {pool_status['total_users']}\n",
+        ]
 
         if pool_status.get("created_at"):
-            text += f"📅 Created: {pool_status['created_at']}"
+            parts.append(f"📅 Created: {pool_status['created_at']}")
 
-        await update.message.reply_text(text)
+        await update.message.reply_text("".join(parts))
 
+    @admin_required
     async def refresh_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /refresh command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide keyword.\nUsage: `/refresh <keyword>`",
             )
             return
 
-        keyword = context.args[0]
+        orig = context.args[0]
+        keyword = orig.strip().lower()
         await update.message.reply_text(
-            f"🔄 Refreshing user pool for keyword: {keyword}"
+            f"🔄 Refreshing user pool for keyword: {orig}"
         )
 
         success = await self.search_engine.build_user_pool_for_keyword(keyword)
 
         if success:
             await update.message.reply_text(
-                f"✅ User pool refreshed for keyword: {keyword}"
+                f"✅ User pool refreshed for keyword: {orig}"
             )
         else:
             await update.message.reply_text(
-                f"❌ Failed to refresh user pool for keyword: {keyword}"
+                f"❌ Failed to refresh user pool for keyword: {orig}"
             )
 
+    @admin_required
     async def backup_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /backup command"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
-            backup_path = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            backup_path = f"backup_{_file_timestamp()}.json"
             success = self.db.backup_database(backup_path)
 
             if success:
@@ -1451,12 +1888,9 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error creating backup: {str(e)}")
 
+    @admin_required
     async def test_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /test command - test bot authentication and basic functionality"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         await update.message.reply_text(
             "🧪 Testing bot authentication and functionality..."
         )
@@ -1478,21 +1912,28 @@ Bot Status:
             can_perform = worker._can_perform_action()
             test_results.append(f"✅ Can perform actions: {can_perform}")
 
-            # Test 3: Try to get user info
-            try:
-                # Try to get current user info
-                user_info = await worker.client.user()
-                if user_info:
-                    username = getattr(
-                        user_info,
-                        "screen_name",
-                        getattr(user_info, "username", "Unknown"),
-                    )
-                    test_results.append(f"✅ User info retrieved: @{username}")
-                else:
-                    test_results.append("❌ Failed to get user info")
-            except Exception as e:
-                test_results.append(f"❌ User info error: {str(e)}")
+            # Test 3: Get user info - reuse what the worker already knows
+            # unless a live check was requested with `/test live`
+            live_check = bool(context.args) and context.args[0].lower() == "live"
+            if worker.twitter_username and not live_check:
+                test_results.append(
+                    f"✅ User info (cached): @{worker.twitter_username}"
+                )
+            else:
+                try:
+                    user_info = await worker.client.user()
+                    if user_info:
+                        username = getattr(
+                            user_info,
+                            "screen_name",
+                            getattr(user_info, "username", "Unknown"),
+                        )
+                        worker.twitter_username = username
+                        test_results.append(f"✅ User info retrieved: @{username}")
+                    else:
+                        test_results.append("❌ Failed to get user info")
+                except Exception as e:
+                    test_results.append(f"❌ User info error: {str(e)}")
 
             # Format results
             result_text = "🧪 Bot Test Results:\n\n" + "\n".join(test_results)
@@ -1501,12 +1942,9 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Test failed with error: {str(e)}")
 
+    @admin_required
     async def reinit_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /reinit command - reinitialize bot authentication"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         await update.message.reply_text("🔄 Reinitializing bot authentication...")
 
         try:
@@ -1516,45 +1954,43 @@ Bot Status:
                 await update.message.reply_text("❌ No workers found to reinitialize.")
                 return
 
-            results = []
-            for bot_id, worker in workers.items():
+            # Reinitialize workers concurrently, a few at a time so Twitter
+            # doesn't rate-limit the burst
+            semaphore = asyncio.Semaphore(8)
+
+            async def reinit_one(worker: TwitterWorker) -> str:
                 try:
-                    success = await worker.reinitialize()
+                    async with semaphore:
+                        success = await worker.reinitialize()
                     if success:
-                        results.append(f"✅ {bot_id}: Reinitialized successfully")
-                    else:
-                        results.append(f"❌ {bot_id}: Reinitialization failed")
+                        return f"✅ {worker.bot_id}: Reinitialized successfully"
+                    return f"❌ {worker.bot_id}: Reinitialization failed"
                 except Exception as e:
-                    results.append(f"❌ {bot_id}: Error - {str(e)}")
+                    return f"❌ {worker.bot_id}: Error - {str(e)}"
 
-            result_text = "🔄 Reinitialization Results:\n\n" + "\n".join(results)
-            await update.message.reply_text(result_text)
+            results = await asyncio.gather(*(reinit_one(w) for w in workers))
+
+            await self._reply_chunked(
+                update, "🔄 Reinitialization Results:\n\n", results
+            )
 
         except Exception as e:
             await update.message.reply_text(
                 f"❌ Reinitialization failed with error: {str(e)}"
             )
 
+    @admin_required
     async def version_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /version command to check Twikit version"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
-            import twikit
-            import inspect
-
             version_info = f"📦 Twikit Version: {twikit.__version__}\n\n"
 
             # Check if cookies_file parameter is supported
-            login_signature = inspect.signature(twikit.Client.login)
-            cookies_file_supported = "cookies_file" in login_signature.parameters
+            cookies_file_supported = "cookies_file" in _LOGIN_PARAMS
 
             # Check if proxy parameter is supported in Client.__init__
-            client_signature = inspect.signature(twikit.Client.__init__)
-            proxy_supported = "proxy" in client_signature.parameters
-            captcha_solver_supported = "captcha_solver" in client_signature.parameters
+            proxy_supported = "proxy" in _CLIENT_PARAMS
+            captcha_solver_supported = "captcha_solver" in _CLIENT_PARAMS
 
             version_info += f"✅ Features:\n"
             version_info += (
@@ -1578,14 +2014,11 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error checking version: {str(e)}")
 
+    @admin_required
     async def cloudflare_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /cloudflare command to test and get Cloudflare cookies"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
             if not captcha_solver.is_cloudscraper_available():
                 await update.message.reply_text(
@@ -1612,11 +2045,12 @@ Bot Status:
                 }
 
                 # Save to temp file
-                temp_file = f"data/cookies/cloudflare_temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                os.makedirs(os.path.dirname(temp_file), exist_ok=True)
+                temp_file = os.path.join(
+                    Config.COOKIES_PATH,
+                    f"cloudflare_temp_{_file_timestamp()}.json",
+                )
 
-                with open(temp_file, "w") as f:
-                    json.dump(cookie_data, f, indent=2)
+                await asyncio.to_thread(_write_json_file, temp_file, cookie_data)
 
                 await update.message.reply_text(
                     f"✅ Cloudflare cookies obtained!\n\n"
@@ -1635,144 +2069,122 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error: {str(e)}")
 
+    @admin_required
     async def reactivate_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /reactivate command - reactivate inactive bots"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         await update.message.reply_text("🔄 Reactivating inactive bots...")
 
         try:
-            # Get all bots from database
-            all_bots = self.db.get_all_bots()
-            inactive_bots = []
-
-            for bot_id, bot_info in all_bots.items():
-                if bot_info.get("status") == "inactive":
-                    inactive_bots.append(bot_id)
+            inactive_bots = list(self.db.get_bots_by_status("inactive").items())
 
             if not inactive_bots:
                 await update.message.reply_text("✅ No inactive bots found.")
                 return
 
-            results = []
-            for bot_id in inactive_bots:
+            # Initialize workers concurrently, a few at a time so Twitter
+            # doesn't rate-limit the burst
+            semaphore = asyncio.Semaphore(8)
+
+            async def reactivate_one(bot_id: str, bot_info: Dict[str, Any]) -> str:
                 try:
                     # Mark bot as active in database
                     self.db.update_bot_status(bot_id, "active")
 
                     # Create and initialize worker
-                    bot_info = all_bots[bot_id]
-                    worker = TwitterWorker(bot_id, bot_info["cookie_data"], self.db)
+                    worker = TwitterWorker(bot_id, bot_info.get("cookies", {}), self.db)
 
-                    if await worker.initialize():
-                        self.worker_manager.workers[bot_id] = worker
-                        results.append(f"✅ {bot_id}: Reactivated successfully")
-                    else:
-                        results.append(f"❌ {bot_id}: Failed to initialize")
+                    async with semaphore:
+                        initialized = await worker.initialize()
+
+                    if initialized:
+                        self.worker_manager.register_worker(bot_id, worker)
+                        return f"✅ {bot_id}: Reactivated successfully"
+                    return f"❌ {bot_id}: Failed to initialize"
 
                 except Exception as e:
-                    results.append(f"❌ {bot_id}: Error - {str(e)}")
+                    return f"❌ {bot_id}: Error - {str(e)}"
 
-            result_text = "🔄 Reactivation Results:\n\n" + "\n".join(results)
-            await update.message.reply_text(result_text)
+            results = await asyncio.gather(
+                *(reactivate_one(bot_id, bot_info) for bot_id, bot_info in inactive_bots)
+            )
+
+            await self._reply_chunked(update, "🔄 Reactivation Results:\n\n", results)
 
         except Exception as e:
             await update.message.reply_text(f"❌ Reactivation failed with error: {str(e)}")
 
+    @admin_required
     async def checkduplicates_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /checkduplicates command - check for duplicate auth tokens"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
-            all_bots = self.db.get_all_bots()
+            # The database keeps an auth_token index that is only rebuilt
+            # when the bots change, so repeated checks don't rescan
+            bot_count = self.db.count_bots_with_auth_token()
 
-            if not all_bots:
+            if not bot_count:
                 await update.message.reply_text("❌ No bots found in database.")
                 return
 
-            # Check for duplicate auth_tokens
-            auth_tokens = {}
-            duplicates = []
-
-            for bot_id, bot_info in all_bots.items():
-                cookies = bot_info.get("cookie_data", {})
-                auth_token = cookies.get("auth_token")
-
-                if auth_token:
-                    if auth_token in auth_tokens:
-                        duplicates.append(
-                            {
-                                "auth_token": auth_token[:10] + "...",
-                                "bots": [auth_tokens[auth_token], bot_id],
-                            }
-                        )
-                    else:
-                        auth_tokens[auth_token] = bot_id
+            duplicates = [
+                {"auth_token": auth_token[:10] + "...", "bots": bot_ids}
+                for auth_token, bot_ids in self.db.get_duplicate_auth_tokens().items()
+            ]
 
             if duplicates:
-                message = "❌ Duplicate auth tokens found:\n\n"
+                parts = ["❌ Duplicate auth tokens found:\n\n"]
                 for dup in duplicates:
-                    message += f"🔑 Token: `{dup['auth_token']}`\n"
-                    message += (
-                        f"🤖 Used by: {', '.join([f'`{bot}`' for bot in dup['bots']])}\n\n"
+                    parts.append(f"🔑 Token: `{dup['auth_token']}`\n")
+                    parts.append(
+                        f"🤖 Used by: {', '.join(f'`{bot}`' for bot in dup['bots'])}\n\n"
                     )
 
-                message += (
+                parts.append(
                     "⚠️ These bots share the same authentication and may conflict.\n"
                 )
-                message += (
+                parts.append(
                     "💡 Consider removing duplicate bots or using different accounts."
                 )
 
-                await update.message.reply_text(message)
+                await update.message.reply_text("".join(parts))
             else:
                 await update.message.reply_text(
                     "✅ No duplicate auth tokens found.\n\n"
-                    f"✅ Checked {len(all_bots)} bots - all have unique authentication."
+                    f"✅ Checked {bot_count} bots - all have unique authentication."
                 )
 
         except Exception as e:
             await update.message.reply_text(f"❌ Error checking duplicates: {str(e)}")
 
+    @admin_required
     async def cleanup_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /cleanup command - remove inactive/failed bots"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
-            all_bots = self.db.get_all_bots()
-
-            if not all_bots:
-                await update.message.reply_text("❌ No bots found in database.")
-                return
-
-            inactive_bots = []
-            for bot_id, bot_info in all_bots.items():
-                if bot_info.get("status") == "inactive":
-                    inactive_bots.append(bot_id)
+            inactive_bots = list(self.db.get_bots_by_status("inactive"))
 
             if not inactive_bots:
                 await update.message.reply_text("✅ No inactive bots found to clean up.")
                 return
 
-            # Remove inactive bots
-            removed_count = 0
-            for bot_id in inactive_bots:
-                try:
-                    success = await self.worker_manager.remove_worker(bot_id)
-                    if success:
-                        removed_count += 1
-                except Exception as e:
-                    self.logger.error(f"Failed to remove bot {bot_id}: {e}")
+            # Remove inactive bots concurrently, bounded so a large cleanup
+            # doesn't hammer the database all at once
+            semaphore = asyncio.Semaphore(16)
+
+            async def remove_one(bot_id: str) -> bool:
+                async with semaphore:
+                    try:
+                        return await self.worker_manager.remove_worker(bot_id)
+                    except Exception as e:
+                        self.logger.error(f"Failed to remove bot {bot_id}: {e}")
+                        return False
+
+            outcomes = await asyncio.gather(
+                *(remove_one(bot_id) for bot_id in inactive_bots)
+            )
+            removed_count = sum(1 for outcome in outcomes if outcome)
 
             await update.message.reply_text(
                 f"🧹 Cleanup completed!\n\n"
@@ -1783,12 +2195,9 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error during cleanup: {str(e)}")
 
+    @admin_required
     async def disable_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Disable a bot (mark as inactive)"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide a bot ID.\nUsage: /disable <bot_id>"
@@ -1810,12 +2219,9 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error disabling bot {bot_id}: {str(e)}")
 
+    @admin_required
     async def enable_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Enable a bot (mark as active and reinitialize)"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide a bot ID.\nUsage: /enable <bot_id>"
@@ -1839,12 +2245,9 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error enabling bot {bot_id}: {str(e)}")
 
+    @admin_required
     async def delete_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Permanently delete a bot"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide a bot ID.\nUsage: /delete <bot_id>"
@@ -1854,94 +2257,112 @@ Bot Status:
         bot_id = context.args[0]
 
         try:
-            # Confirm deletion
-            confirm_text = (
+            # Confirm deletion through a one-time inline button; the token
+            # ties the button to this request and expires after 60 seconds
+            token = secrets.token_hex(4)
+            context.user_data["pending_deletion"] = {
+                "token": token,
+                "bot_id": bot_id,
+                "expires_at": time.time() + 60,
+            }
+
+            keyboard = [
+                [
+                    InlineKeyboardButton(
+                        "YES, delete", callback_data=f"del:{bot_id}:{token}"
+                    )
+                ],
+                [InlineKeyboardButton("Cancel", callback_data=f"del_cancel:{token}")],
+            ]
+            await update.message.reply_text(
                 f"⚠️ WARNING: This will permanently delete bot {bot_id}!\n\n"
                 f"This action cannot be undone.\n"
-                f"Reply with 'YES' to confirm deletion."
+                f"Confirm within 60 seconds.",
+                reply_markup=InlineKeyboardMarkup(keyboard),
             )
-            await update.message.reply_text(confirm_text)
-
-            # Store the pending deletion for confirmation
-            context.user_data["pending_deletion"] = bot_id
 
         except Exception as e:
             await update.message.reply_text(
                 f"❌ Error preparing deletion of bot {bot_id}: {str(e)}"
             )
 
-    async def handle_deletion_confirmation(
-        self, update: Update, context: ContextTypes.DEFAULT_TYPE
-    ):
-        """Handle deletion confirmation"""
-        if not self._is_admin(update.effective_user.id):
-            return
+    async def _handle_delete_confirmation(self, query, context, data: str):
+        """Handle the YES/Cancel buttons sent by /delete"""
+        # Buttons on an older /delete message must not touch a newer
+        # pending deletion, so only drop the entry once the token matches
+        pending = context.user_data.get("pending_deletion")
+        prefix, token = data.rsplit(":", 1)
+        matches = pending is not None and pending["token"] == token
 
-        pending_deletion = context.user_data.get("pending_deletion")
-        if not pending_deletion:
+        if prefix == "del_cancel":
+            if matches:
+                context.user_data.pop("pending_deletion", None)
+                await query.edit_message_text(
+                    f"❌ Deletion of bot {pending['bot_id']} cancelled."
+                )
+            else:
+                await query.edit_message_text("❌ Deletion cancelled.")
             return
 
-        if update.message.text.upper() == "YES":
-            try:
-                success = await self.worker_manager.delete_worker(pending_deletion)
+        bot_id = prefix[len("del:"):]
+        if (
+            not matches
+            or pending["bot_id"] != bot_id
+            or time.time() > pending["expires_at"]
+        ):
+            await query.edit_message_text(
+                "❌ This deletion request has expired. Run /delete again."
+            )
+            return
 
-                if success:
-                    await update.message.reply_text(
-                        f"✅ Bot {pending_deletion} deleted permanently."
-                    )
-                else:
-                    await update.message.reply_text(
-                        f"❌ Failed to delete bot {pending_deletion}. Bot may not exist."
-                    )
+        context.user_data.pop("pending_deletion", None)
 
-                # Clear pending deletion
-                del context.user_data["pending_deletion"]
+        try:
+            success = await self.worker_manager.delete_worker(bot_id)
 
-            except Exception as e:
-                await update.message.reply_text(
-                    f"❌ Error deleting bot {pending_deletion}: {str(e)}"
+            if success:
+                await query.edit_message_text(f"✅ Bot {bot_id} deleted permanently.")
+            else:
+                await query.edit_message_text(
+                    f"❌ Failed to delete bot {bot_id}. Bot may not exist."
                 )
-                del context.user_data["pending_deletion"]
-        else:
-            # User didn't confirm, cancel deletion
-            await update.message.reply_text(
-                f"❌ Deletion of bot {pending_deletion} cancelled."
-            )
-            del context.user_data["pending_deletion"]
 
+        except Exception as e:
+            await query.edit_message_text(f"❌ Error deleting bot {bot_id}: {str(e)}")
+
+    @admin_required
     async def savecookies_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /savecookies command to save bot cookies to files"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
             workers = self.worker_manager.get_all_workers()
             if not workers:
                 await update.message.reply_text("❌ No bots found to save cookies for.")
                 return
 
-            saved_count = 0
-            for bot_id, worker in workers.items():
-                try:
-                    # Get cookies from the worker's client
-                    cookies = worker.client.get_cookies()
-
-                    # Create cookie file path
-                    cookie_file_path = os.path.join(
-                        Config.COOKIES_PATH, f"{bot_id}_cookies.json"
+            # Save every bot's cookies concurrently with Twikit's (blocking)
+            # save_cookies, keeping the file I/O off the event loop
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        worker.client.save_cookies,
+                        _cookie_file_path(worker.bot_id),
                     )
-                    os.makedirs(os.path.dirname(cookie_file_path), exist_ok=True)
+                    for worker in workers
+                ),
+                return_exceptions=True,
+            )
 
-                    # Save cookies to file using Twikit's method
-                    worker.client.save_cookies(cookie_file_path)
+            saved_count = 0
+            for worker, result in zip(workers, results):
+                if isinstance(result, Exception):
+                    self.logger.error(
+                        f"Failed to save cookies for bot {worker.bot_id}: {result}"
+                    )
+                else:
                     saved_count += 1
 
-                except Exception as e:
-                    self.logger.error(f"Failed to save cookies for bot {bot_id}: {e}")
-
             await update.message.reply_text(
                 f"✅ Cookies saved for {saved_count}/{len(workers)} bots to {Config.COOKIES_PATH}"
             )
@@ -1949,58 +2370,30 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error saving cookies: {str(e)}")
 
+    @admin_required
     async def update_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /update command to pull latest code and restart bot"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
-        # Create update options keyboard
-        keyboard = [
-            [
-                InlineKeyboardButton(
-                    "🔄 Update & Restart Bot", callback_data="update_restart_bot"
-                ),
-                InlineKeyboardButton(
-                    "🔄 Restart Bot Only", callback_data="restart_bot_only"
-                ),
-            ],
-            [
-                InlineKeyboardButton(
-                    "🔄 Restart System", callback_data="restart_system"
-                ),
-                InlineKeyboardButton("📋 Check Status", callback_data="check_status"),
-            ],
-            [InlineKeyboardButton("❌ Cancel", callback_data="cancel_update")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
         await update.message.reply_text(
             "🔄 **Update & Restart Options**\n\nChoose what you want to do:",
-            reply_markup=reply_markup,
+            reply_markup=self._update_markup,
             parse_mode="Markdown",
         )
 
+    @admin_required
     async def restart_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /restart command to restart bot without updating"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
-            await update.message.reply_text("🔄 Restarting bot...")
+            await update.message.reply_text(
+                "🔄 Restarting bot... it will be back in a few seconds."
+            )
             await self.restart_bot()
-            await update.message.reply_text("✅ Bot restarted successfully!")
 
         except Exception as e:
             await update.message.reply_text(f"❌ Error restarting bot: {str(e)}")
 
+    @admin_required
     async def addadmin_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /addadmin command to add a new admin"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide a Telegram user ID.\n"
@@ -2012,6 +2405,7 @@ Bot Status:
         try:
             new_admin_id = context.args[0]
             if self.db.add_admin(new_admin_id):
+                self._db_admin_ids = None
                 await update.message.reply_text(
                     f"✅ Successfully added admin: {new_admin_id}\n"
                     f"They can now use bot commands."
@@ -2023,12 +2417,9 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error adding admin: {str(e)}")
 
+    @admin_required
     async def removeadmin_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /removeadmin command to remove an admin"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "❌ Please provide a Telegram user ID.\n"
@@ -2048,6 +2439,7 @@ Bot Status:
                 return
             
             if self.db.remove_admin(admin_id):
+                self._db_admin_ids = None
                 await update.message.reply_text(
                     f"✅ Successfully removed admin: {admin_id}"
                 )
@@ -2058,12 +2450,9 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error removing admin: {str(e)}")
 
+    @admin_required
     async def listadmins_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /listadmins command to list all admins"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
         try:
             admins = self.db.get_admins()
             env_admins = Config.TELEGRAM_ADMIN_IDS
@@ -2090,29 +2479,32 @@ Bot Status:
         except Exception as e:
             await update.message.reply_text(f"❌ Error listing admins: {str(e)}")
 
+    @admin_required
     async def _handle_single_action(
         self,
         update: Update,
         context: ContextTypes.DEFAULT_TYPE,
-        task_type: TaskType,
         action_name: str,
     ):
         """Handle single action commands"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
+        usage = f"Usage: `/{action_name} https://twitter.com/user/status/123456789`"
         if not context.args:
             await update.message.reply_text(
-                f"❌ Please provide a Twitter URL.\n"
-                f"Usage: `/{action_name} https://twitter.com/user/status/123456789`",
+                f"❌ Please provide a Twitter URL.\n{usage}",
             )
             return
 
         url = context.args[0]
 
+        # Reject malformed links here instead of letting the task fail later
+        if not _TWEET_URL_RE.match(url):
+            await update.message.reply_text(f"❌ Invalid tweet URL.\n{usage}")
+            return
+
         try:
-            task_id = await self.scheduler.add_task(task_type, {"tweet_url": url})
+            task_id = await self.scheduler.add_task(
+                _SINGLE_ACTION_TASKS[action_name], {"tweet_url": url}
+            )
 
             await update.message.reply_text(
                 f"✅ {action_name.title()} task scheduled!\n🔗 URL: {url}\n📋 Task ID: {task_id}"
@@ -2127,35 +2519,93 @@ Bot Status:
         """Check if user is admin (from .env or database)"""
         user_id_str = str(user_id)
         # Check .env file admins
-        if user_id_str in self.config.TELEGRAM_ADMIN_IDS:
+        if user_id_str in self._env_admin_ids:
             return True
-        # Check database admins
-        db_admins = self.db.get_admins()
-        return user_id_str in db_admins
+        # Check database admins (cached until /addadmin or /removeadmin)
+        if self._db_admin_ids is None:
+            self._db_admin_ids = frozenset(self.db.get_admins())
+        return user_id_str in self._db_admin_ids
+
+    async def _reply_chunked(
+        self, update: Update, header: str, lines: List[str], max_chars: int = 3500
+    ):
+        """Reply with header + newline-joined lines, split to fit Telegram's limit"""
+        messages = []
+        current = header
+        separator = ""
+        for line in lines:
+            if current and len(current) + len(separator) + len(line) > max_chars:
+                messages.append(current)
+                current, separator = "", ""
+            current += separator + line
+            separator = "\n"
+        if current:
+            messages.append(current)
+
+        for message in messages:
+            await update.message.reply_text(message)
+
+    def _check_new_cookies(self, processed_cookies: Dict[str, Any], source: str):
+        """
+        Validate cookies for a new bot and check their auth_token is unused
+
+        Args:
+            processed_cookies: Cookies in Twikit format
+            source: What the cookies came from ("cookie data", "cookie file")
+
+        Returns:
+            (validation, error_message) - error_message is None if usable
+        """
+        validation = CookieProcessor.validate_cookies(processed_cookies)
+
+        if not validation["valid"]:
+            parts = [f"❌ Invalid {source}!\n\n"]
+
+            if validation["missing"]:
+                parts.append(
+                    f"Missing required cookies: {', '.join(validation['missing'])}\n\n"
+                )
+
+            if validation["errors"]:
+                parts.append("Critical errors:\n")
+                parts.extend(f"• {error}\n" for error in validation["errors"])
+                parts.append("\n")
+
+            if validation["warnings"]:
+                parts.append("Warnings:\n")
+                parts.extend(f"• {warning}\n" for warning in validation["warnings"])
+
+            return validation, "".join(parts)
+
+        # Check for duplicate cookies (same auth_token)
+        if "auth_token" in processed_cookies:
+            bot_id = self.db.find_bot_by_auth_token(processed_cookies["auth_token"])
+            if bot_id:
+                return validation, (
+                    f"❌ Duplicate {source} detected!\n\n"
+                    f"This auth_token is already used by bot: `{bot_id}`\n\n"
+                    f"Each bot must have unique authentication cookies.\n"
+                    f"Please export fresh cookies from a different account or remove the existing bot first."
+                )
+
+        return validation, None
 
     def _validate_cookie_data(self, cookie_data: Dict[str, Any]) -> bool:
         """Validate cookie data structure"""
         # Handle both raw browser export format and processed format
         if isinstance(cookie_data, list):
             # Raw browser export format - process it
-            from cookie_processor import CookieProcessor
-
             processed = CookieProcessor.process_cookies(cookie_data)
-            return (
-                len(processed) >= 2 and "auth_token" in processed and "ct0" in processed
-            )
+            return _REQUIRED_COOKIE_FIELDS.issubset(processed)
         elif isinstance(cookie_data, dict):
             # Already processed format
-            required_fields = ["auth_token", "ct0"]
-            return all(field in cookie_data for field in required_fields)
+            return _REQUIRED_COOKIE_FIELDS.issubset(cookie_data)
         return False
 
     def _process_raw_cookies(self, cookie_data: Any) -> Dict[str, Any]:
         """Process raw browser cookie export to Twikit format"""
         if isinstance(cookie_data, list):
             # Raw browser export format
-            from cookie_processor import CookieProcessor
-
             return CookieProcessor.process_cookies(cookie_data)
         elif isinstance(cookie_data, dict):
             # Already processed
@@ -2171,84 +2621,38 @@ Bot Status:
         await query.answer()
 
         if not self._is_admin(query.from_user.id):
-            await query.edit_message_text("❌ Access denied. You are not an admin.")
+            await query.edit_message_text(_ACCESS_DENIED)
             return
 
         data = query.data
 
-        if data == "menu_status":
-            await self._show_status_menu(query)
-        elif data == "menu_bots":
-            await self._show_bot_management_menu(query)
-        elif data == "menu_engagement":
-            await self._show_engagement_menu(query)
-        elif data == "menu_search":
-            await self._show_search_menu(query)
-        elif data == "menu_stats":
-            await self._show_stats_menu(query)
-        elif data == "menu_system":
-            await self._show_system_menu(query)
-        elif data == "menu_help":
-            await self._show_help_menu(query)
-        elif data == "menu_logs":
-            await self._show_logs_menu(query)
-        elif data == "back_to_main":
-            await self._show_main_menu(query)
-        elif data.startswith("bot_"):
-            await self._handle_bot_action(query, data)
-        elif data.startswith("engagement_"):
-            await self._handle_engagement_action(query, data)
-        elif data.startswith("system_"):
-            await self._handle_system_action(query, data)
-        elif data.startswith("update_"):
-            await self._handle_update_action(query, data)
-        elif data.startswith("restart_"):
-            await self._handle_restart_action(query, data)
-        elif data == "check_status":
-            await self._handle_status_check(query)
-        elif data == "cancel_update":
-            await query.edit_message_text("❌ Update operation cancelled.")
+        handler = self._exact_routes.get(data)
+        if handler:
+            await handler(query)
+        elif data.startswith(("del:", "del_cancel:")):
+            await self._handle_delete_confirmation(query, context, data)
+        else:
+            for prefix, prefix_handler in self._prefix_routes:
+                if data.startswith(prefix):
+                    await prefix_handler(query, data)
+                    break
+
+    async def _cancel_update(self, query):
+        """Handle the Cancel button of the /update menu"""
+        await query.edit_message_text("❌ Update operation cancelled.")
 
     # Menu display methods
     async def _show_main_menu(self, query):
         """Show the main menu"""
-        welcome_text = """
-🤖 **Twitter Bot System**
-
-Welcome to your Twitter automation command center!
-
-Choose an action from the menu below:
-        """
-
-        keyboard = [
-            [
-                InlineKeyboardButton("📊 Status", callback_data="menu_status"),
-                InlineKeyboardButton("🤖 Bot Management", callback_data="menu_bots"),
-            ],
-            [
-                InlineKeyboardButton("🎯 Engagement", callback_data="menu_engagement"),
-                InlineKeyboardButton("🔍 Search & Pools", callback_data="menu_search"),
-            ],
-            [
-                InlineKeyboardButton("📈 Statistics", callback_data="menu_stats"),
-                InlineKeyboardButton("⚙️ System", callback_data="menu_system"),
-            ],
-            [
-                InlineKeyboardButton("📋 Help", callback_data="menu_help"),
-                InlineKeyboardButton("📝 Logs", callback_data="menu_logs"),
-            ],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
         await query.edit_message_text(
-            welcome_text, reply_markup=reply_markup, parse_mode="Markdown"
+            _WELCOME_TEXT, reply_markup=self._main_menu_markup, parse_mode="Markdown"
         )
 
     async def _show_status_menu(self, query):
         """Show status menu"""
         # Get actual status
-        active_workers = len(self.worker_manager.get_active_workers())
-        total_workers = len(self.worker_manager.get_all_workers())
+        active_workers = self.worker_manager.get_active_worker_count()
+        total_workers = self.worker_manager.get_worker_count()
 
         status_text = f"""
 📊 **System Status**
@@ -2256,243 +2660,85 @@ Choose an action from the menu below:
 🤖 **Bots:** {active_workers}/{total_workers} active
 🔄 **Tasks:** Running
 🔌 **Proxy:** {'✅ Configured' if Config.PROXY_URL else '❌ Not configured'}
-📅 **Last Update:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+📅 **Last Update:** {datetime.now().isoformat(sep=" ", timespec="seconds")}
 
 Choose an action:
         """
 
-        keyboard = [
-            [
-                InlineKeyboardButton("🔄 Refresh Status", callback_data="menu_status"),
-                InlineKeyboardButton("🤖 View All Bots", callback_data="menu_bots"),
-            ],
-            [
-                InlineKeyboardButton("📈 Detailed Stats", callback_data="menu_stats"),
-                InlineKeyboardButton("📝 View Logs", callback_data="menu_logs"),
-            ],
-            [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        await query.edit_message_text(
+            status_text, reply_markup=self._menu_markups["status"], parse_mode="Markdown"
+        )
+
+    async def _show_bot_management_menu(self, query):
+        """Show bot management menu"""
+        bot_text = f"""
+🤖 **Bot Management**
+
+Total Bots: {self.worker_manager.get_worker_count()}
+
+Choose an action:
+        """
 
         await query.edit_message_text(
-            status_text, reply_markup=reply_markup, parse_mode="Markdown"
+            bot_text, reply_markup=self._menu_markups["bots"], parse_mode="Markdown"
         )
 
-    async def _show_system_menu(self, query):
-        """Show system menu"""
-        system_text = """
-⚙️ **System Management**
-
-System administration and maintenance:
+    async def _show_engagement_menu(self, query):
+        """Show engagement menu"""
+        await query.edit_message_text(
+            _ENGAGEMENT_MENU_TEXT,
+            reply_markup=self._menu_markups["engagement"],
+            parse_mode="Markdown",
+        )
 
-**Available Actions:**
-• Test system components
-• Reinitialize bots
-• Version information
-• System diagnostics
-        """
+    async def _show_search_menu(self, query):
+        """Show search and pools menu"""
+        await query.edit_message_text(
+            _SEARCH_MENU_TEXT, reply_markup=self._menu_markups["search"], parse_mode="Markdown"
+        )
 
-        keyboard = [
-            [
-                InlineKeyboardButton("🧪 Test System", callback_data="system_test"),
-                InlineKeyboardButton("🔄 Reinitialize", callback_data="system_reinit"),
-            ],
-            [
-                InlineKeyboardButton("📋 Version Info", callback_data="system_version"),
-                InlineKeyboardButton(
-                    "🔧 Diagnostics", callback_data="system_diagnostics"
-                ),
-            ],
-            [
-                InlineKeyboardButton("💾 Backup", callback_data="system_backup"),
-                InlineKeyboardButton("🔍 Test Login", callback_data="system_testlogin"),
-            ],
-            [
-                InlineKeyboardButton("⬆️ Update Bot", callback_data="system_update"),
-                InlineKeyboardButton("🔄 Restart Bot", callback_data="system_restart"),
-            ],
-            [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+    async def _show_stats_menu(self, query):
+        """Show statistics menu"""
+        await query.edit_message_text(
+            _STATS_MENU_TEXT,
+            reply_markup=self._menu_markups["stats"],
+        )
 
+    async def _show_system_menu(self, query):
+        """Show system menu"""
         await query.edit_message_text(
-            system_text, reply_markup=reply_markup, parse_mode="Markdown"
+            _SYSTEM_MENU_TEXT, reply_markup=self._menu_markups["system"], parse_mode="Markdown"
         )
 
     async def _show_help_menu(self, query):
         """Show help menu"""
-        help_text = """
-📋 **Help & Commands**
-
-**Quick Commands:**
-• `/start` - Show main menu
-• `/help` - Detailed command reference
-• `/status` - System status
-• `/logs` - View recent logs
-
-**Bot Management:**
-• `/addbot` - Add new bot
-• `/listbots` - List all bots
-• `/removebot <id>` - Remove bot
-
-**Engagement:**
-• `/post <url>` - Engage with post
-• `/quote <keyword> "<text>"` - Quote tweet
-• `/like <url>` - Like post
-• `/comment <url> "<text>"` - Comment
-
-Use the menu buttons for easy access!
-        """
-
-        keyboard = [
-            [
-                InlineKeyboardButton("📖 Full Help", callback_data="help_full"),
-                InlineKeyboardButton("💡 Tips", callback_data="help_tips"),
-            ],
-            [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
         await query.edit_message_text(
-            help_text, reply_markup=reply_markup, parse_mode="Markdown"
+            _HELP_MENU_TEXT, reply_markup=self._menu_markups["help"], parse_mode="Markdown"
         )
 
     async def _show_logs_menu(self, query):
         """Show logs menu"""
-        logs_text = """
-📝 **System Logs**
-
-View recent system activity and logs:
-
-**Log Types:**
-• System logs
-• Bot activity
-• Error logs
-• Engagement logs
-        """
-
-        keyboard = [
-            [
-                InlineKeyboardButton("📋 Recent Logs", callback_data="logs_recent"),
-                InlineKeyboardButton("❌ Error Logs", callback_data="logs_errors"),
-            ],
-            [
-                InlineKeyboardButton("🤖 Bot Logs", callback_data="logs_bots"),
-                InlineKeyboardButton("🎯 Activity Logs", callback_data="logs_activity"),
-            ],
-            [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
         await query.edit_message_text(
-            logs_text, reply_markup=reply_markup, parse_mode="Markdown"
+            _LOGS_MENU_TEXT, reply_markup=self._menu_markups["logs"], parse_mode="Markdown"
         )
 
     async def _handle_bot_action(self, query, data):
         """Handle bot management actions"""
-        if data == "bot_add":
-            await query.edit_message_text(
-                "🤖 **Add Bot**\n\n"
-                "Choose how to add a bot:\n"
-                "• Upload cookie file and use `/addbot <filename>`\n"
-                "• Use `/addbotjson <json_data>` for direct JSON\n"
-                "• Use `/addbotlogin <username> <password>` for login\n\n"
-                "Or use the commands directly!",
-                parse_mode="Markdown",
-            )
-        elif data == "bot_list":
-            await query.edit_message_text(
-                "📋 **Bot List**\n\n"
-                "Use `/listbots` to see all your bots with their status.",
-                parse_mode="Markdown",
-            )
-        elif data == "bot_sync":
-            await query.edit_message_text(
-                "🔄 **Sync Follows**\n\n"
-                "Use `/syncfollows` to sync mutual following between all bots.",
-                parse_mode="Markdown",
-            )
-        elif data == "bot_cleanup":
-            await query.edit_message_text(
-                "🧹 **Cleanup**\n\n"
-                "Use `/cleanup` to remove inactive/failed bots from the database.",
-                parse_mode="Markdown",
-            )
+        text = _BOT_ACTION_TEXT.get(data)
+        if text:
+            await query.edit_message_text(text, parse_mode="Markdown")
 
     async def _handle_engagement_action(self, query, data):
         """Handle engagement actions"""
-        if data == "engagement_post":
-            await query.edit_message_text(
-                "💬 **Post Engagement**\n\n"
-                "Use `/post <url>` to like, comment, and retweet a post.",
-                parse_mode="Markdown",
-            )
-        elif data == "engagement_quote":
-            await query.edit_message_text(
-                "💭 **Quote Tweet**\n\n"
-                'Use `/quote <keyword> "<message>"` to quote tweets with mentions.',
-                parse_mode="Markdown",
-            )
-        elif data == "engagement_like":
-            await query.edit_message_text(
-                "❤️ **Like Post**\n\nUse `/like <url>` to like a specific post.",
-                parse_mode="Markdown",
-            )
-        elif data == "engagement_retweet":
-            await query.edit_message_text(
-                "🔄 **Retweet**\n\nUse `/retweet <url>` to retweet a specific post.",
-                parse_mode="Markdown",
-            )
-        elif data == "engagement_comment":
-            await query.edit_message_text(
-                '💬 **Comment**\n\nUse `/comment <url> "<text>"` to comment on a post.',
-                parse_mode="Markdown",
-            )
-        elif data == "engagement_unfollow":
-            await query.edit_message_text(
-                "👥 **Unfollow**\n\n"
-                "Use `/unfollow <bot_id>` or `/unfollow all` to unfollow users.",
-                parse_mode="Markdown",
-            )
+        text = _ENGAGEMENT_ACTION_TEXT.get(data)
+        if text:
+            await query.edit_message_text(text, parse_mode="Markdown")
 
     async def _handle_system_action(self, query, data):
         """Handle system actions"""
-        if data == "system_test":
-            await query.edit_message_text(
-                "🧪 **Test System**\n\n"
-                "Use `/test` to test bot authentication and functionality.",
-                parse_mode="Markdown",
-            )
-        elif data == "system_reinit":
-            await query.edit_message_text(
-                "🔄 **Reinitialize**\n\n"
-                "Use `/reinit` to reinitialize bot authentication for all workers.",
-                parse_mode="Markdown",
-            )
-        elif data == "system_version":
-            await query.edit_message_text(
-                "📋 **Version Info**\n\n"
-                "Use `/version` to check Twikit version and capabilities.",
-                parse_mode="Markdown",
-            )
-        elif data == "system_testlogin":
-            await query.edit_message_text(
-                "🔍 **Test Login**\n\n"
-                "Use `/testlogin` to test if login is blocked by Cloudflare.",
-                parse_mode="Markdown",
-            )
-        elif data == "system_update":
-            await query.edit_message_text(
-                "⬆️ **Update Bot**\n\n"
-                "Use `/update` to pull latest code from GitHub and restart the bot.",
-                parse_mode="Markdown",
-            )
-        elif data == "system_restart":
-            await query.edit_message_text(
-                "🔄 **Restart Bot**\n\n"
-                "Use `/restart` to restart the bot without updating code.",
-                parse_mode="Markdown",
-            )
+        text = _SYSTEM_ACTION_TEXT.get(data)
+        if text:
+            await query.edit_message_text(text, parse_mode="Markdown")
 
     async def _handle_update_action(self, query, data):
         """Handle update-related actions"""
@@ -2502,27 +2748,35 @@ View recent system activity and logs:
             )
 
             success, message, output = await self.update_and_restart_bot()
+            restart = success and "already up to date" not in message.lower()
 
             if success:
-                if "already up to date" in message.lower():
+                if not restart:
                     response_text = (
                         "✅ **Update Complete**\n\nBot is already up to date!"
                     )
                 else:
-                    response_text = f"✅ **Update Complete**\n\n{message}\n\n**Changes:**\n```\n{output[:300]}\n```"
+                    # Backticks in git output would close the code fence and
+                    # make Telegram reject the Markdown
+                    safe_output = output[:_UPDATE_OUTPUT_LIMIT].replace("`", "'")
+                    response_text = f"✅ **Update Complete**\n\n{message}\n\n**Changes:**\n```\n{safe_output}\n```"
             else:
                 response_text = f"❌ **Update Failed**\n\n{message}"
 
             await query.edit_message_text(response_text, parse_mode="Markdown")
 
+            # Only once the summary is out - the restart ends this process
+            if restart:
+                await self.restart_bot()
+
     async def _handle_restart_action(self, query, data):
         """Handle restart-related actions"""
         if data == "restart_bot_only":
-            await query.edit_message_text("🔄 Restarting bot...")
-
             try:
+                await query.edit_message_text(
+                    "🔄 Restarting bot... it will be back in a few seconds."
+                )
                 await self.restart_bot()
-                await query.edit_message_text("✅ Bot restarted successfully!")
             except Exception as e:
                 await query.edit_message_text(f"❌ Error restarting bot: {str(e)}")
 
@@ -2544,53 +2798,67 @@ View recent system activity and logs:
 
         status_text = await self.check_system_status()
 
-        # Add refresh button
-        keyboard = [
-            [InlineKeyboardButton("🔄 Refresh Status", callback_data="check_status")],
-            [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
         await query.edit_message_text(
-            status_text, reply_markup=reply_markup, parse_mode="Markdown"
+            status_text,
+            reply_markup=self._menu_markups["status_check"],
+            parse_mode="Markdown",
         )
 
     async def restart_bot(self):
-        """Restart the bot process"""
+        """Ask main() to stop the system and restart the bot process"""
+        # Stopping from inside a handler would deadlock: application.stop()
+        # waits for pending handlers, including the one calling us
+        self.logger.info("Restart requested")
+        self.restart_requested = True
+        self.shutdown_event.set()
+
+    def exec_restart(self):
+        """Replace this process with a fresh bot (after stop_system)"""
+        # Replace this process in place so the old and new bot never
+        # long-poll Telegram at the same time (409 Conflict)
+        os.chdir("/root/Twitter-bot")
         try:
-            # Stop current bot
-            await self.stop_system()
+            os.execv(sys.executable, [sys.executable, "main.py"])
+        except OSError as e:
+            self.logger.error(f"execv failed, starting a new process: {e}")
+            import subprocess
 
-            # Start new process with the correct file
             subprocess.Popen(["python3", "main.py"], cwd="/root/Twitter-bot")
 
-        except Exception as e:
-            self.logger.error(f"Error restarting bot: {e}")
+    async def _run_command(self, *args: str, cwd: Optional[str] = None):
+        """Run a command without blocking the event loop
+
+        Returns (returncode, stdout, stderr) with the output decoded.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        return (
+            proc.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
 
     async def update_and_restart_bot(self):
         """Update code from GitHub and restart bot"""
         try:
             # Pull latest changes
-            result = subprocess.run(
-                ["git", "pull", "origin", "main"],
-                capture_output=True,
-                text=True,
-                cwd="/root/Twitter-bot",
+            returncode, stdout, stderr = await self._run_command(
+                "git", "pull", "origin", "main", cwd="/root/Twitter-bot"
             )
 
-            if result.returncode == 0:
-                if "Already up to date" in result.stdout:
-                    return True, "Bot is already up to date!", result.stdout
+            if returncode == 0:
+                if "Already up to date" in stdout:
+                    return True, "Bot is already up to date!", stdout
                 else:
-                    # Restart the bot
-                    await self.restart_bot()
-                    return (
-                        True,
-                        "Bot updated and restarted successfully!",
-                        result.stdout,
-                    )
+                    # The caller restarts once it has replied to the admin
+                    return True, "Bot updated - restarting now...", stdout
             else:
-                return False, f"Git pull failed: {result.stderr}", result.stderr
+                return False, f"Git pull failed: {stderr}", stderr
 
         except Exception as e:
             return False, f"Error during update: {str(e)}", ""
@@ -2599,19 +2867,17 @@ View recent system activity and logs:
         """Restart the webhook listener system service"""
         try:
             # Restart webhook listener service
-            result = subprocess.run(
-                ["sudo", "systemctl", "restart", "webhook-listener.service"],
-                capture_output=True,
-                text=True,
+            returncode, _, stderr = await self._run_command(
+                "sudo", "systemctl", "restart", "webhook-listener.service"
             )
 
-            if result.returncode == 0:
+            if returncode == 0:
                 return True, "Webhook listener service restarted successfully!", ""
             else:
                 return (
                     False,
-                    f"Failed to restart service: {result.stderr}",
-                    result.stderr,
+                    f"Failed to restart service: {stderr}",
+                    stderr,
                 )
 
         except Exception as e:
@@ -2635,7 +2901,7 @@ View recent system activity and logs:
 📊 Type: {task.task_type.value}
 ⏱️ Duration: {duration:.1f}s
 🔄 Status: {status_text}
-📅 Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+📅 Time: {datetime.now().isoformat(sep=" ", timespec="seconds")}
 """
             
             # Send to all admin users
@@ -2658,60 +2924,122 @@ View recent system activity and logs:
         except Exception as e:
             self.logger.error(f"Error in task completion callback: {e}")
     
-    async def check_system_status(self):
-        """Check status of bot and services"""
+    def _probe_bot_process(self):
+        """Return (running, pid) for the bot process named in the PID file"""
+        # Only needed by the status check - keep psutil out of bot start-up
+        import psutil
+
+        # Look up the PID written at start-up rather than walking every
+        # process on the host
         try:
-            # Check bot process
-            bot_running = False
-            bot_pid = None
-            for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-                try:
-                    if proc.info["name"] in [
-                        "python",
-                        "python3",
-                    ] and "main.py" in " ".join(proc.info["cmdline"]):
-                        bot_running = True
-                        bot_pid = proc.info["pid"]
-                        break
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-
-            # Check webhook service status
-            service_result = subprocess.run(
-                ["sudo", "systemctl", "is-active", "webhook-listener.service"],
+            with open(Config.PID_FILE, encoding="utf-8") as f:
+                pid = int(f.read().strip())
+        except (OSError, ValueError):
+            return self._pgrep_bot_process()
+
+        try:
+            proc = psutil.Process(pid)
+            if proc.name().startswith("python") and "main.py" in " ".join(
+                proc.cmdline()
+            ):
+                return True, pid
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+        # Stale file (dead or reused PID) - look for the process instead
+        return self._pgrep_bot_process()
+
+    def _pgrep_bot_process(self):
+        """Return (running, pid) for main.py via pgrep, without a usable PID file"""
+        import subprocess
+
+        # Runs in the status probe's worker thread, so blocking is fine;
+        # pgrep filters /proc in C instead of a Python loop over every PID
+        try:
+            result = subprocess.run(
+                ["pgrep", "-f", r"python.*main\.py"],
                 capture_output=True,
                 text=True,
             )
-            service_running = service_result.stdout.strip() == "active"
+        except OSError:
+            return False, None
 
-            # Check webhook health
-            try:
-                import requests
+        pids = result.stdout.split()
+        if pids:
+            return True, int(pids[0])
+        return False, None
 
-                health_response = requests.get(
-                    "http://localhost:8080/health", timeout=5
-                )
-                webhook_healthy = health_response.status_code == 200
-            except Exception:
-                webhook_healthy = False
+    async def _webhook_service_state(self) -> Dict[str, str]:
+        """Read the webhook listener unit's state in one systemctl call"""
+        try:
+            # Read-only systemctl queries (show, is-active) must not go
+            # through sudo - it only adds a fork and a PAM round trip
+            _, stdout, _ = await self._run_command(
+                "systemctl",
+                "show",
+                "webhook-listener.service",
+                "--property=ActiveState,SubState,MainPID",
+                "--no-pager",
+            )
+        except Exception:
+            return {}
 
-            status_text = f"""
-📊 **System Status**
+        state = {}
+        for line in stdout.splitlines():
+            key, sep, value = line.partition("=")
+            if sep:
+                state[key] = value
+        return state
+
+    async def _check_webhook_health(self) -> bool:
+        """Check the webhook listener's /health endpoint"""
+        # One session is reused across status checks so the connection is
+        # kept alive; it is created here because it needs the running loop
+        if self._http is None or self._http.closed:
+            # Only the status check uses aiohttp - keep it out of bot start-up
+            import aiohttp
+
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=2)
+            )
 
-🤖 **Bot Process:**
-• Status: {"🟢 Running" if bot_running else "🔴 Stopped"}
-• PID: {bot_pid if bot_pid else "N/A"}
+        try:
+            async with self._http.get("http://localhost:8080/health") as response:
+                return response.status == 200
+        except Exception:
+            return False
 
-🔄 **Webhook Service:**
-• Status: {"🟢 Active" if service_running else "🔴 Inactive"}
-• Health: {"🟢 Healthy" if webhook_healthy else "🔴 Unhealthy"}
+    async def check_system_status(self):
+        """Check status of bot and services, reusing a report under 3s old"""
+        now = time.monotonic()
+        if self._status_cache and now - self._status_cache[0] < self._status_cache_ttl:
+            return self._status_cache[1]
 
-🔌 **Proxy:**
-• Configured: {"✅ Yes" if Config.PROXY_URL else "❌ No"}
+        try:
+            # The three probes are independent - run them side by side
+            (bot_running, bot_pid), service_state, webhook_healthy = (
+                await asyncio.gather(
+                    asyncio.to_thread(self._probe_bot_process),
+                    self._webhook_service_state(),
+                    self._check_webhook_health(),
+                )
+            )
+            service_running = service_state.get("ActiveState") == "active"
+            service_pid = service_state.get("MainPID", "0")
 
-📅 **Last Check:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-            """
+            status_text = _SYSTEM_STATUS_TEMPLATE.format_map(
+                {
+                    "bot_status": "🟢 Running" if bot_running else "🔴 Stopped",
+                    "bot_pid": bot_pid or "N/A",
+                    "service_status": "🟢 Active" if service_running else "🔴 Inactive",
+                    "service_pid": service_pid if service_pid != "0" else "N/A",
+                    "webhook_health": "🟢 Healthy" if webhook_healthy else "🔴 Unhealthy",
+                    "proxy_status": "✅ Yes" if Config.PROXY_URL else "❌ No",
+                    "checked_at": datetime.now().isoformat(sep=" ", timespec="seconds"),
+                }
+            )
 
+            self._status_cache = (now, status_text)
             return status_text
 
         except Exception as e:
@@ -2747,18 +3075,20 @@ View recent system activity and logs:
             await self.application.initialize()
             await self.application.start()
 
-            # Start polling for updates with timeout
-            try:
-                await asyncio.wait_for(
-                    self.application.updater.start_polling(), timeout=10.0
-                )
-            except asyncio.TimeoutError:
-                self.logger.warning("Telegram polling timeout, but continuing...")
-                # Continue anyway - polling might still work
+            # start_polling returns once polling is set up; updates queued
+            # while the bot was down are dropped rather than replayed
+            await self.application.updater.start_polling(drop_pending_updates=True)
 
             self.is_running = True
             self.logger.info("✅ Twitter Bot System started successfully!")
 
+            # Record our PID for check_system_status
+            try:
+                with open(Config.PID_FILE, "w", encoding="utf-8") as f:
+                    f.write(str(os.getpid()))
+            except OSError as e:
+                self.logger.warning(f"Failed to write PID file {Config.PID_FILE}: {e}")
+
             # Set bot commands for autocomplete
             try:
                 await self.set_bot_commands()
@@ -2770,10 +3100,10 @@ View recent system activity and logs:
             try:
                 await self.logger.send_notification(
                     "🚀 Twitter Bot System Started\n\n"
-                    f"🤖 Workers: {len(self.worker_manager.get_all_workers())}\n"
+                    f"🤖 Workers: {self.worker_manager.get_worker_count()}\n"
                     f"✅ Config: Valid\n"
                     f"🔌 Proxy: {'Configured' if Config.PROXY_URL else 'Not configured'}\n"
-                    f"📅 Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                    f"📅 Time: {datetime.now().isoformat(sep=' ', timespec='seconds')}",
                     "INFO",
                 )
             except Exception as e:
@@ -2787,52 +3117,7 @@ View recent system activity and logs:
 
     async def set_bot_commands(self):
         """Set bot commands for Telegram's autocomplete"""
-        from telegram import BotCommand
-
-        commands = [
-            BotCommand("start", "Show main menu"),
-            BotCommand("help", "Show all available commands"),
-            BotCommand("status", "Show system and bot status"),
-            BotCommand("logs", "View recent system logs"),
-            BotCommand("addbot", "Add new worker bot from cookie file"),
-            BotCommand("addbotjson", "Add bot directly with JSON cookie data"),
-            BotCommand("addbotlogin", "Add bot via username/password login"),
-            BotCommand("removebot", "Remove worker bot"),
-            BotCommand("disable", "Disable a bot (mark as inactive)"),
-            BotCommand("enable", "Enable a disabled bot"),
-            BotCommand("delete", "Permanently delete a bot"),
-            BotCommand("listbots", "List all worker bots and their status"),
-            BotCommand("syncfollows", "Sync mutual following between all bots"),
-            BotCommand("post", "Like, comment, and retweet a specific post"),
-            BotCommand("like", "Like a specific post"),
-            BotCommand("retweet", "Retweet a specific post"),
-            BotCommand("comment", "Comment on a specific post"),
-            BotCommand("quote", "Quote tweets containing keyword with mentions"),
-            BotCommand("unfollow", "Unfollow all followers for a specific bot"),
-            BotCommand("search", "Search for tweets with keyword"),
-            BotCommand("pool", "Show user pool status for keyword"),
-            BotCommand("refresh", "Refresh user pool for keyword"),
-            BotCommand("stats", "Show engagement statistics"),
-            BotCommand("queue", "Show pending and in-progress tasks"),
-            BotCommand("test", "Diagnose bot authentication and basic functionality"),
-            BotCommand("reinit", "Reinitialize bot authentication for all workers"),
-            BotCommand("version", "Check Twikit version and capabilities"),
-            BotCommand("testlogin", "Test if login is blocked by Cloudflare"),
-            BotCommand("captchastatus", "Show captcha solver and proxy status"),
-            BotCommand("cloudflare", "Get Cloudflare cookies for bypass"),
-            BotCommand("reactivate", "Reactivate inactive bots"),
-            BotCommand("checkduplicates", "Check for duplicate auth_tokens"),
-            BotCommand("cleanup", "Remove all inactive bots from the database"),
-            BotCommand("savecookies", "Save all bot cookies to files"),
-            BotCommand(
-                "update",
-                "Interactive update menu (update & restart, restart only, restart system, check status)",
-            ),
-            BotCommand("restart", "Restart bot without updating code"),
-            BotCommand("backup", "Create backup of system data"),
-        ]
-
-        await self.application.bot.set_my_commands(commands)
+        await self.application.bot.set_my_commands(_BOT_COMMANDS)
 
     async def stop_system(self):
         """Stop the entire system"""
@@ -2846,15 +3131,33 @@ View recent system activity and logs:
             await self.application.updater.stop()
             await self.application.stop()
 
+            if self._http is not None:
+                await self._http.close()
+                self._http = None
+
+            # A PID file left behind would name a dead or reused PID
+            try:
+                os.remove(Config.PID_FILE)
+            except OSError:
+                pass
+
             self.is_running = False
             self.logger.info("Twitter Bot System stopped successfully!")
 
         except Exception as e:
             self.logger.error(f"Error stopping system: {e}")
 
+        finally:
+            self.shutdown_event.set()
+
 
 async def main():
     """Main entry point"""
+    # Start tasks eagerly where the interpreter supports it (3.12+)
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
     bot = TwitterBotTelegram()
 
     try:
@@ -2862,9 +3165,10 @@ async def main():
         if not success:
             return
 
-        # Keep the bot running
-        while bot.is_running:
-            await asyncio.sleep(1)
+        # Keep the bot running until stop_system or restart_bot signals
+        await bot.shutdown_event.wait()
+        if bot.is_running:
+            await bot.stop_system()
 
     except KeyboardInterrupt:
         print("\nShutting down...")
@@ -2874,257 +3178,9 @@ async def main():
         print(f"Fatal error: {e}")
         await bot.stop_system()
 
-
-    async def _show_bot_management_menu(self, query):
-        """Show bot management menu"""
-        bots = self.worker_manager.get_all_workers()
-
-        bot_text = f"""
-🤖 **Bot Management**
-
-Total Bots: {len(bots)}
-
-Choose an action:
-        """
-
-        keyboard = [
-            [
-                InlineKeyboardButton("➕ Add Bot", callback_data="bot_add"),
-                InlineKeyboardButton("📋 List Bots", callback_data="bot_list"),
-            ],
-            [
-                InlineKeyboardButton("🔄 Sync Follows", callback_data="bot_sync"),
-                InlineKeyboardButton("🧹 Cleanup", callback_data="bot_cleanup"),
-            ],
-            [
-                InlineKeyboardButton(
-                    "💾 Save Cookies", callback_data="bot_save_cookies"
-                ),
-                InlineKeyboardButton(
-                    "🔍 Check Duplicates", callback_data="bot_check_duplicates"
-                ),
-            ],
-            [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await query.edit_message_text(
-            bot_text, reply_markup=reply_markup, parse_mode="Markdown"
-        )
-
-    async def _show_engagement_menu(self, query):
-        """Show engagement menu"""
-        engagement_text = """
-🎯 **Engagement Actions**
-
-Choose an engagement action:
-
-**Quick Actions:**
-• Like, comment, and retweet posts
-• Quote tweets with mentions
-• Manage user pools
-• Unfollow operations
-        """
-
-        keyboard = [
-            [
-                InlineKeyboardButton(
-                    "💬 Post Engagement", callback_data="engagement_post"
-                ),
-                InlineKeyboardButton(
-                    "💭 Quote Tweet", callback_data="engagement_quote"
-                ),
-            ],
-            [
-                InlineKeyboardButton("❤️ Like Post", callback_data="engagement_like"),
-                InlineKeyboardButton("🔄 Retweet", callback_data="engagement_retweet"),
-            ],
-            [
-                InlineKeyboardButton("💬 Comment", callback_data="engagement_comment"),
-                InlineKeyboardButton(
-                    "👥 Unfollow", callback_data="engagement_unfollow"
-                ),
-            ],
-            [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await query.edit_message_text(
-            engagement_text, reply_markup=reply_markup, parse_mode="Markdown"
-        )
-
-    async def _show_search_menu(self, query):
-        """Show search and pools menu"""
-        search_text = """
-🔍 **Search & Pools**
-
-Manage Twitter search and user pools:
-
-**Features:**
-• Search for tweets by keywords
-• Manage user pools for mentions
-• Refresh user data
-• Track engagement targets
-        """
-
-        keyboard = [
-            [
-                InlineKeyboardButton("🔍 Search Tweets", callback_data="search_tweets"),
-                InlineKeyboardButton("👥 Manage Pools", callback_data="search_pools"),
-            ],
-            [
-                InlineKeyboardButton(
-                    "🔄 Refresh Pools", callback_data="search_refresh"
-                ),
-                InlineKeyboardButton("📊 Pool Stats", callback_data="search_stats"),
-            ],
-            [InlineKeyboardButton("⬅️ Back to Main", callback_data="back_to_main")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await query.edit_message_text(
-            search_text, reply_markup=reply_markup, parse_mode="Markdown"
-        )
-
-    async def _show_stats_menu(self, query):
-        """Show statistics menu"""
-        stats_text = """
-📈 **Statistics & Analytics**
-
-View detailed system statistics:
-
-**Available Stats:**
-• Engagement metrics
-• Bot performance
-• Task completion rates
-• System health
-        """
-
-        keyboard = [
-            [
-                InlineKeyboardButton(
-                    "📊 Engagement Stats", callback_data="stats_engagement"
-                ),
-                InlineKeyboardButton("🤖 Bot Performance", callback_data="stats_bots"),
-            ],
-            [
-                InlineKeyboardButton("⚡ Task Queue", callback_data="stats_queue"),
-                InlineKeyboardButton(
-                    "💾 Database Stats", callback_data="stats_database"
-                ),
-            ],
-            [InlineKeyboardButton("⬅️ Back to Main", callback_data="menu_main")],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await query.edit_message_text(
-            "📈 Statistics Menu\n\nChoose a category:",
-            reply_markup=reply_markup,
-        )
-
-    async def _handle_single_action(
-        self, update: Update, context: ContextTypes.DEFAULT_TYPE, task_type: TaskType, action_name: str
-    ):
-        """Handle single action commands (like, retweet, comment)"""
-        if not self._is_admin(update.effective_user.id):
-            await update.message.reply_text("❌ Access denied. You are not an admin.")
-            return
-
-        if not context.args:
-            await update.message.reply_text(
-                f"❌ Please provide a Twitter URL.\n"
-                f"Usage: `/{action_name} https://twitter.com/user/status/123456789`"
-            )
-            return
-
-        url = context.args[0]
-
-        try:
-            task_id = await self.scheduler.add_task(task_type, {"tweet_url": url})
-            await update.message.reply_text(
-                f"✅ {action_name.title()} task scheduled!\n"
-                f"📋 Task ID: {task_id}\n"
-                f"🔗 URL: {url}"
-            )
-        except Exception as e:
-            await update.message.reply_text(f"❌ Error scheduling {action_name}: {str(e)}")
-
-    def _is_admin(self, user_id: int) -> bool:
-        """Check if user is admin (from .env or database)"""
-        user_id_str = str(user_id)
-        # Check .env file admins
-        if user_id_str in self.config.TELEGRAM_ADMIN_IDS:
-            return True
-        # Check database admins
-        db_admins = self.db.get_admins()
-        return user_id_str in db_admins
-
-    def _process_raw_cookies(self, raw_cookie_data: List[Dict]) -> Dict[str, str]:
-        """Process raw cookie data from browser export"""
-        processed_cookies = {}
-
-        if isinstance(raw_cookie_data, list):
-            # Handle browser export format
-            for cookie in raw_cookie_data:
-                if isinstance(cookie, dict) and "name" in cookie and "value" in cookie:
-                    processed_cookies[cookie["name"]] = cookie["value"]
-        elif isinstance(raw_cookie_data, dict):
-            # Handle already processed format
-            processed_cookies = raw_cookie_data
-
-        return processed_cookies
-
-    async def start(self):
-        """Start the bot system"""
-        try:
-            self.logger.info("Starting Twitter Bot System...")
-
-            # Validate configuration
-            config_validation = self.config.validate_config()
-            if not config_validation["valid"]:
-                self.logger.error(f"Configuration issues: {config_validation['issues']}")
-                return False
-
-            # Start worker manager
-            await self.worker_manager.start()
-
-            # Start scheduler
-            await self.scheduler.start()
-
-            # Start Telegram bot
-            await self.application.initialize()
-            await self.application.start()
-            await self.application.updater.start_polling()
-
-            self.is_running = True
-            self.logger.info("Twitter Bot System started successfully!")
-            return True
-
-        except Exception as e:
-            self.logger.error(f"Failed to start system: {e}")
-            return False
-
-    async def stop(self):
-        """Stop the bot system"""
-        try:
-            self.logger.info("Stopping Twitter Bot System...")
-
-            # Stop scheduler
-            await self.scheduler.stop()
-
-            # Stop worker manager
-            await self.worker_manager.stop()
-
-            # Stop Telegram bot
-            await self.application.updater.stop()
-            await self.application.stop()
-            await self.application.shutdown()
-
-            self.is_running = False
-            self.logger.info("Twitter Bot System stopped successfully!")
-
-        except Exception as e:
-            self.logger.error(f"Error stopping system: {e}")
+    # Outside every handler now, so nothing is left waiting on this process
+    if bot.restart_requested:
+        bot.exec_restart()
 
 
 if __name__ == "__main__":
@@ -9,15 +9,17 @@ import psutil
 import requests
 from datetime import datetime
 
+_PYTHON_NAMES = frozenset(("python", "python3"))
+
 
 def find_bot_process():
     """Find the running bot process"""
-    for proc in psutil.process_iter(["pid", "name", "cmdline"]):
+    for proc in psutil.process_iter(["name", "cmdline"]):
         try:
-            if proc.info["name"] in ["python", "python3"] and "main.py" in " ".join(
-                proc.info["cmdline"]
+            if proc.info["name"] in _PYTHON_NAMES and any(
+                "main.py" in arg for arg in proc.info["cmdline"] or ()
             ):
-                return proc.info["pid"]
+                return proc.pid
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
     return None
@@ -26,8 +28,9 @@ def find_bot_process():
 def check_webhook_service():
     """Check if webhook service is running"""
     try:
+        # Read-only systemctl queries don't need root - no sudo fork/PAM
         result = subprocess.run(
-            ["sudo", "systemctl", "is-active", "webhook-listener.service"],
+            ["systemctl", "is-active", "webhook-listener.service"],
             capture_output=True,
             text=True,
         )
@@ -212,8 +212,7 @@ class TwitterSearchEngine:
     def get_user_pool_status(self, keyword: str) -> Dict[str, Any]:
         """Get status of user pool for a keyword"""
         try:
-            data = self.db._read_data()
-            pool = data.get("users_pool", {}).get(keyword, {})
+            pool = self.db.get_user_pool(keyword)
 
             return {
                 "keyword": keyword,
@@ -233,14 +232,7 @@ class TwitterSearchEngine:
         """Refresh user pool by searching for new users"""
         try:
             # Clear existing pool
-            data = self.db._read_data()
-            if keyword in data.get("users_pool", {}):
-                data["users_pool"][keyword] = {
-                    "users": [],
-                    "used_users": [],
-                    "created_at": datetime.now().isoformat(),
-                }
-                self.db._write_data(data)
+            self.db.reset_user_pool(keyword, datetime.now().isoformat())
 
             # Build new pool
             return asyncio.create_task(self.build_user_pool_for_keyword(keyword, limit))
@@ -29,6 +29,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Interpreter names the bot process runs under
+_PYTHON_NAMES = frozenset(("python", "python3"))
+
 # Initialize Flask app
 app = Flask(__name__)
 
@@ -76,13 +79,14 @@ async def send_telegram_notification(message, level="INFO"):
 def find_bot_process():
     """Find the running bot process"""
     try:
-        for proc in psutil.process_iter(["pid", "name", "cmdline"]):
+        for proc in psutil.process_iter(["name", "cmdline"]):
             try:
-                cmdline = " ".join(proc.info["cmdline"] or [])
-                if proc.info["name"] in ["python", "python3"] and (
-                    "main.py" in cmdline
+                # Check the name first and scan argv in place - no joined
+                # string per process, and stop at the first match
+                if proc.info["name"] in _PYTHON_NAMES and any(
+                    "main.py" in arg for arg in proc.info["cmdline"] or ()
                 ):
-                    return proc.info["pid"]
+                    return proc.pid
             except (psutil.NoSuchProcess, psutil.AccessDenied, TypeError):
                 continue
         return None
@@ -4,13 +4,24 @@ Worker Manager - Enhanced with proper proxy support
 
 import asyncio
 import inspect
+import os
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from twikit import Client
+
+try:
+    from twikit._captcha.capsolver import Capsolver as TwikitCapsolver
+except ImportError:  # Not shipped by every Twikit version
+    TwikitCapsolver = None
+
 from config import Config
 from database import Database
 from logger import bot_logger
 
+# Supported Client parameters are fixed for the installed Twikit version
+_CLIENT_PARAMS = inspect.signature(Client.__init__).parameters
+
 
 class TwitterWorker:
     """Individual Twitter bot worker with proxy support"""
@@ -41,21 +52,18 @@ class TwitterWorker:
         # Get captcha solver if available
         captcha_solver_instance = None
         if Config.USE_CAPTCHA_SOLVER and Config.CAPSOLVER_API_KEY:
-            try:
-                from twikit._captcha.capsolver import Capsolver as TwikitCapsolver
-
+            if TwikitCapsolver is not None:
                 captcha_solver_instance = TwikitCapsolver(
                     api_key=Config.CAPSOLVER_API_KEY,
                     max_attempts=Config.CAPSOLVER_MAX_ATTEMPTS,
                     get_result_interval=Config.CAPSOLVER_RESULT_INTERVAL,
                 )
                 self.logger.info(f"{self.bot_id}: Captcha solver configured")
-            except ImportError:
+            else:
                 self.logger.warning(f"{self.bot_id}: Twikit Capsolver not available")
 
-        # Detect supported Client parameters
-        client_sig = inspect.signature(Client.__init__)
-        params = client_sig.parameters
+        # Supported Client parameters (detected once at import)
+        params = _CLIENT_PARAMS
 
         # Build client kwargs
         client_kwargs = {"language": "en-US"}
@@ -65,45 +73,30 @@ class TwitterWorker:
             client_kwargs["proxy"] = proxy_url
             self.logger.info(f"{self.bot_id}: Using proxy: {proxy_url[:50]}...")
 
-            # For residential proxies with SSL certificate issues, disable SSL verification
+            # For residential proxies with SSL certificate issues, configure SSL settings
             # This is necessary because residential proxies often use self-signed certificates
-            try:
-                import httpx
-                import ssl
-
-                # Create SSL context that doesn't verify certificates
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-
-                # Check if httpx_kwargs parameter is supported
-                if "httpx_kwargs" in params:
-                    # Check if we have a custom SSL certificate for the proxy
-                    import os
-
-                    cert_path = Config.PROXY_SSL_CERT
-                    if cert_path and os.path.exists(cert_path):
-                        # Use the SSL certificate (e.g., Bright Data certificate)
-                        client_kwargs["httpx_kwargs"] = {"verify": cert_path}
+            if "httpx_kwargs" in params:
+                # Check if we have a custom SSL certificate for the proxy
+                cert_path = Config.PROXY_SSL_CERT
+                if cert_path and os.path.exists(cert_path):
+                    # Use the SSL certificate (e.g., Bright Data certificate)
+                    client_kwargs["httpx_kwargs"] = {"verify": cert_path}
+                    self.logger.info(
+                        f"{self.bot_id}: Using SSL certificate: {cert_path}"
+                    )
+                else:
+                    # Use config setting
+                    client_kwargs["httpx_kwargs"] = {
+                        "verify": Config.PROXY_SSL_VERIFY
+                    }
+                    if not Config.PROXY_SSL_VERIFY:
                         self.logger.info(
-                            f"{self.bot_id}: Using SSL certificate: {cert_path}"
+                            f"{self.bot_id}: SSL verification disabled for proxy"
                         )
                     else:
-                        # Use config setting
-                        client_kwargs["httpx_kwargs"] = {
-                            "verify": Config.PROXY_SSL_VERIFY
-                        }
-                        if not Config.PROXY_SSL_VERIFY:
-                            self.logger.info(
-                                f"{self.bot_id}: SSL verification disabled for proxy"
-                            )
-                        else:
-                            self.logger.info(
-                                f"{self.bot_id}: SSL verification enabled for proxy"
-                            )
-
-            except ImportError:
-                self.logger.warning(f"{self.bot_id}: Could not configure SSL settings")
+                        self.logger.info(
+                            f"{self.bot_id}: SSL verification enabled for proxy"
+                        )
 
         # Add captcha solver if supported and configured
         if "captcha_solver" in params and captcha_solver_instance:
@@ -630,6 +623,15 @@ class WorkerManager:
         self.logger = bot_logger
         self.is_running = False
 
+        # Short-lived snapshot of get_all_worker_statuses() so bursts of
+        # status-like commands share a single walk over the workers
+        self._status_cache: Optional[tuple] = None
+        self._status_cache_ttl = 2.0
+
+        # Monotonic bot id counter, persisted under "next_bot_id"
+        self._id_lock = asyncio.Lock()
+        self._next_id: Optional[int] = None
+
     async def start(self):
         """Start the worker manager"""
         try:
@@ -657,6 +659,7 @@ class WorkerManager:
                 await worker.cleanup()
 
             self.workers.clear()
+            self._invalidate_status_cache()
 
             self.logger.info("Worker Manager stopped")
 
@@ -701,6 +704,7 @@ class WorkerManager:
                     else:
                         self.logger.error(f"Failed to initialize worker: {bot_id}")
 
+            self._invalidate_status_cache()
             self.logger.info(f"Loaded {len(self.workers)} workers from database")
 
         except Exception as e:
@@ -729,7 +733,7 @@ class WorkerManager:
             worker = TwitterWorker(bot_id, cookie_data, self.db)
 
             if await worker.initialize():
-                self.workers[bot_id] = worker
+                self.register_worker(bot_id, worker)
                 self.logger.info(f"Worker {bot_id} added successfully")
                 return True
             else:
@@ -753,6 +757,7 @@ class WorkerManager:
 
             # Remove from workers dict
             del self.workers[bot_id]
+            self._invalidate_status_cache()
 
             # Remove from database
             self.db.remove_bot(bot_id)
@@ -775,6 +780,7 @@ class WorkerManager:
 
             # Reinitialize worker
             success = await worker.reinitialize()
+            self._invalidate_status_cache()
             if not success:
                 self.logger.error(f"Failed to restart worker {bot_id}")
                 return False
@@ -794,10 +800,18 @@ class WorkerManager:
         """Get all workers"""
         return list(self.workers.values())
 
+    def get_worker_count(self) -> int:
+        """Get the number of workers without copying them"""
+        return len(self.workers)
+
     def get_active_workers(self) -> List[TwitterWorker]:
         """Get all active (logged in) workers"""
         return [worker for worker in self.workers.values() if worker.is_logged_in]
 
+    def get_active_worker_count(self) -> int:
+        """Count active (logged in) workers without building a list"""
+        return sum(1 for worker in self.workers.values() if worker.is_logged_in)
+
     def get_available_worker(self) -> Optional[TwitterWorker]:
         """Get an available worker (not rate limited, no captcha required)"""
         for worker in self.workers.values():
@@ -813,8 +827,48 @@ class WorkerManager:
         return None
 
     def get_all_worker_statuses(self) -> Dict[str, Dict[str, Any]]:
-        """Get status of all workers"""
-        return {bot_id: worker.get_status() for bot_id, worker in self.workers.items()}
+        """Get status of all workers (cached for a couple of seconds)"""
+        now = time.monotonic()
+        if self._status_cache and now - self._status_cache[0] < self._status_cache_ttl:
+            return self._status_cache[1]
+
+        statuses = {
+            bot_id: worker.get_status() for bot_id, worker in self.workers.items()
+        }
+        self._status_cache = (now, statuses)
+        return statuses
+
+    def register_worker(self, bot_id: str, worker: TwitterWorker):
+        """Track an initialized worker and refresh the cached statuses"""
+        self.workers[bot_id] = worker
+        self._invalidate_status_cache()
+
+    def _invalidate_status_cache(self):
+        """Drop the cached worker statuses after the worker set changes"""
+        self._status_cache = None
+
+    def _load_next_id(self) -> int:
+        """Read the persisted id counter, never going below existing bot ids"""
+        data = self.db.get_all_data()
+        next_id = data.get("next_bot_id", 0)
+        if not isinstance(next_id, int):
+            next_id = 0
+
+        for bot_id in data.get("bots", {}):
+            suffix = str(bot_id).rsplit("_", 1)[-1]
+            if suffix.isdigit():
+                next_id = max(next_id, int(suffix))
+
+        return next_id
+
+    async def allocate_bot_id(self) -> str:
+        """Reserve a unique bot id (safe under concurrent adds)"""
+        async with self._id_lock:
+            if self._next_id is None:
+                self._next_id = self._load_next_id()
+            self._next_id += 1
+            self.db.set_data("next_bot_id", self._next_id)
+            return f"bot_{self._next_id}"
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get worker manager statistics"""